@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import importlib
 import logging
+import sys
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,25 +16,20 @@ from .const import (
     CONF_EE_HOST,
     CONF_EE_INSTALL_PATH,
     CONF_EE_PORT,
+    CONF_ENABLE_EXEC_LUA,
     CONF_HEADLESS_INTERNET,
     CONF_HEADLESS_NAME,
     CONF_SCENARIO,
     CONF_POLL_INTERVAL,
     CONF_SACN_UNIVERSE,
     CONF_SSH_HOST,
-    CONF_SSH_KEY,
-    CONF_SSH_KNOWN_HOSTS,
-    CONF_SSH_PASSWORD,
-    CONF_SSH_PORT,
-    CONF_SSH_SKIP_HOST_KEY_CHECK,
-    CONF_SSH_USERNAME,
     DEFAULT_INIT_SCENARIO,
     DOMAIN,
 )
 from .coordinator import EmptyEpsilonCoordinator
 from .diagnostics import async_get_config_entry_diagnostics
-from .services import async_setup_services
-from .ssh_manager import SSHManager
+from .services import async_evict_ssh_pool, async_setup_services, async_update_single_entry
+from .ssh_manager import SSHManager, ssh_kwargs_from_config
 
 __all__ = ["async_get_config_entry_diagnostics", "async_setup", "async_setup_entry", "async_unload_entry"]
 
@@ -60,18 +58,22 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     data[CONF_HEADLESS_NAME] = options.get(CONF_HEADLESS_NAME, "EmptyEpsilon")
     data[CONF_HEADLESS_INTERNET] = options.get(CONF_HEADLESS_INTERNET, False)
     data[CONF_SCENARIO] = options.get(CONF_SCENARIO, DEFAULT_INIT_SCENARIO)
+    data[CONF_ENABLE_EXEC_LUA] = options.get(CONF_ENABLE_EXEC_LUA, True)
+
+    # Import asyncssh in HA's executor now so the first SSH action does not wait on it;
+    # the future is kept in hass.data so later setups reuse it and auto-start can await it
+    if "asyncssh" not in sys.modules and DOMAIN + "_asyncssh_import" not in hass.data:
+        hass.data[DOMAIN + "_asyncssh_import"] = hass.async_add_executor_job(
+            importlib.import_module, "asyncssh"
+        )
 
     # Auto-start EE only on first setup (not on HA restart)
     if not options.get(OPTION_HAS_AUTO_STARTED, False):
-        ssh = SSHManager(
-            host=data[CONF_SSH_HOST],
-            port=data.get(CONF_SSH_PORT, 22),
-            username=data[CONF_SSH_USERNAME],
-            password=data.get(CONF_SSH_PASSWORD) or None,
-            key_filename=(data.get(CONF_SSH_KEY) or "").strip() or None,
-            known_hosts=data.get(CONF_SSH_KNOWN_HOSTS),
-            skip_host_key_check=data.get(CONF_SSH_SKIP_HOST_KEY_CHECK, True),
-        )
+        if (asyncssh_import := hass.data.get(DOMAIN + "_asyncssh_import")) is not None:
+            # A failed import is reported by SSHManager.connect
+            with contextlib.suppress(ImportError):
+                await asyncssh_import
+        ssh = SSHManager(**ssh_kwargs_from_config(data))
         install_path = data.get(CONF_EE_INSTALL_PATH, "/usr/local/bin")
         ee_port = data.get(CONF_EE_PORT, 8080)
         sacn_universe = data.get(CONF_SACN_UNIVERSE, 2)
@@ -109,6 +111,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
     await coordinator.async_config_entry_first_refresh()
     hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+    async_update_single_entry(hass)
 
     await coordinator.start_sacn()
 
@@ -128,9 +131,12 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     coordinator: EmptyEpsilonCoordinator = hass.data[DOMAIN].get(config_entry.entry_id)
     if coordinator:
         coordinator.stop_sacn()
+        await coordinator.async_shutdown()
+        await async_evict_ssh_pool(coordinator.ssh_kwargs)
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, ["sensor", "binary_sensor", "switch", "button"]
     )
     if unload_ok and DOMAIN in hass.data:
         hass.data[DOMAIN].pop(config_entry.entry_id, None)
+        async_update_single_entry(hass)
     return unload_ok
@@ -22,15 +22,16 @@ async def async_setup_entry(
     coordinator: EmptyEpsilonCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     config = config_entry.data
     entry_id = config_entry.entry_id
+    sacn_coordinator = coordinator.sacn_coordinator
 
     entities = [
         EmptyEpsilonServerReachableSensor(coordinator, entry_id, config),
         EmptyEpsilonHTTPServerSensor(coordinator, entry_id, config),
-        EmptyEpsilonHasShipSensor(coordinator, entry_id, config),
+        EmptyEpsilonHasShipSensor(sacn_coordinator, entry_id, config),
         EmptyEpsilonGamePausedSensor(coordinator, entry_id, config),
-        EmptyEpsilonSACNBinarySensor(coordinator, entry_id, "shieldsUp", "Shields up", "mdi:shield"),
-        EmptyEpsilonSACNBinarySensor(coordinator, entry_id, "docked", "Docked", "mdi:anchor"),
-        EmptyEpsilonSACNBinarySensor(coordinator, entry_id, "docking", "Docking", "mdi:ship-wheel"),
+        EmptyEpsilonSACNBinarySensor(sacn_coordinator, entry_id, "shieldsUp", "Shields up", "mdi:shield"),
+        EmptyEpsilonSACNBinarySensor(sacn_coordinator, entry_id, "docked", "Docked", "mdi:anchor"),
+        EmptyEpsilonSACNBinarySensor(sacn_coordinator, entry_id, "docking", "Docking", "mdi:ship-wheel"),
     ]
     async_add_entities(entities)
 
@@ -52,7 +53,7 @@ class EmptyEpsilonServerReachableSensor(EmptyEpsilonEntity, BinarySensorEntity):
         if http.get("server_reachable"):
             return True
         # If we have recent sACN data with hasShip or any channel, consider reachable
-        sacn = self.coordinator.data.get("sacn", {})
+        sacn = self.coordinator.sacn
         return bool(sacn and (sacn.get("hasShip", 0) > 0.5 or sacn.get("hull", 0) >= 0))
 
 
@@ -73,7 +74,7 @@ class EmptyEpsilonHTTPServerSensor(EmptyEpsilonEntity, BinarySensorEntity):
 
 
 class EmptyEpsilonHasShipSensor(EmptyEpsilonEntity, BinarySensorEntity):
-    """Whether a player ship exists (from sACN HasShip)."""
+    """Whether a player ship exists (from sACN HasShip; uses the sACN coordinator)."""
 
     _attr_translation_key = "has_ship"
 
@@ -82,12 +83,11 @@ class EmptyEpsilonHasShipSensor(EmptyEpsilonEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        sacn = self.coordinator.data.get("sacn", {})
-        return (sacn.get("hasShip") or 0) > 0.5
+        return (self.coordinator.data.get("hasShip") or 0) > 0.5
 
 
 class EmptyEpsilonSACNBinarySensor(EmptyEpsilonEntity, BinarySensorEntity):
-    """Binary sensor from sACN channel (0.0–1.0, threshold 0.5)."""
+    """Binary sensor from sACN channel (0.0–1.0, threshold 0.5); uses the sACN coordinator."""
 
     def __init__(self, coordinator, entry_id, config, key: str, name: str, icon: str | None = None):
         super().__init__(coordinator, entry_id, key, name, icon=icon)
@@ -96,8 +96,7 @@ class EmptyEpsilonSACNBinarySensor(EmptyEpsilonEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        sacn = self.coordinator.data.get("sacn", {})
-        return (sacn.get(self._key) or 0) > 0.5
+        return (self.coordinator.data.get(self._key) or 0) > 0.5
 
 
 class EmptyEpsilonGamePausedSensor(EmptyEpsilonEntity, BinarySensorEntity):
@@ -110,4 +109,4 @@ class EmptyEpsilonGamePausedSensor(EmptyEpsilonEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        return bool(self.coordinator.data.get("http", {}).get("paused"))
+        return self.coordinator.paused
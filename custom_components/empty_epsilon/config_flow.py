@@ -15,6 +15,7 @@ from .const import (
     CONF_EE_HOST,
     CONF_EE_INSTALL_PATH,
     CONF_EE_PORT,
+    CONF_ENABLE_EXEC_LUA,
     CONF_HEADLESS_INTERNET,
     CONF_HEADLESS_NAME,
     CONF_SCENARIO,
@@ -85,14 +86,13 @@ async def _validate_ssh(
     skip_host_key_check: bool,
 ) -> tuple[str | None, str | None]:
     """
-    Validate SSH connection in executor (avoids blocking asyncssh import).
+    Validate SSH connection (SSHManager imports asyncssh off the event loop).
     Returns (error_message, known_hosts_path).
     On first connect with skip=True, fetches and saves host key; known_hosts_path is set.
     """
-    from .ssh_setup import validate_ssh_sync
+    from .ssh_setup import validate_ssh
 
-    result = await hass.async_add_executor_job(
-        validate_ssh_sync,
+    result = await validate_ssh(
         host,
         port,
         username,
@@ -200,7 +200,7 @@ class EmptyEpsilonConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors={"base": "key_or_password_required"},
             )
 
-        # Validate SSH in executor
+        # Validate SSH
         error, known_hosts_path = await _validate_ssh(
             self.hass,
             user_input[CONF_SSH_HOST],
@@ -323,6 +323,10 @@ class EmptyEpsilonOptionsFlow(config_entries.OptionsFlow):
                     CONF_SCENARIO,
                     default=options.get(CONF_SCENARIO, DEFAULT_INIT_SCENARIO),
                 ): str,
+                vol.Optional(
+                    CONF_ENABLE_EXEC_LUA,
+                    default=options.get(CONF_ENABLE_EXEC_LUA, True),
+                ): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
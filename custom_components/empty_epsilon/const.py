@@ -39,7 +39,8 @@ CONF_SCENARIO = "scenario"
 # Used by sacn_listener to decode and by hardware.ini generator to build config.
 # Format: (channel_index_0based, ee_variable, min_in, max_in, min_out, max_out)
 # For variable effect: min_output/max_output typically 0.0/1.0
-SACN_CHANNEL_SPEC = [
+# Tuples, not lists: generate_hardware_ini caches its output on the assumption these never change
+SACN_CHANNEL_SPEC = (
     (1, "Hull", 0, 100, 0.0, 1.0),
     (2, "Shield0", 0, 100, 0.0, 1.0),   # front
     (3, "Shield1", 0, 100, 0.0, 1.0),   # rear
@@ -52,10 +53,10 @@ SACN_CHANNEL_SPEC = [
     (10, "HasShip", 0, 1, 0.0, 1.0),
     (11, "Impulse", -1, 1, 0.0, 1.0),  # EE may output -1..1; we map to 0..1
     (12, "Warp", 0, 4, 0.0, 1.0),
-]
+)
 
 # Names for each channel (for hardware.ini [channel] name and for entity keys)
-SACN_CHANNEL_NAMES = [
+SACN_CHANNEL_NAMES = (
     "hull",
     "frontShield",
     "rearShield",
@@ -68,7 +69,7 @@ SACN_CHANNEL_NAMES = [
     "hasShip",
     "impulse",
     "warp",
-]
+)
 
 # Game status values
 GAME_STATUS_SETUP = "setup"
@@ -1,18 +1,22 @@
-"""DataUpdateCoordinator combining sACN push and HTTP API poll for EmptyEpsilon."""
+"""DataUpdateCoordinators for EmptyEpsilon: HTTP API poll and sACN push."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import timedelta
-from typing import Any
+from functools import cached_property
+from typing import Any, Awaitable, TypeVar
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     CONF_EE_HOST,
     CONF_EE_PORT,
+    CONF_ENABLE_EXEC_LUA,
     CONF_POLL_INTERVAL,
     CONF_SACN_UNIVERSE,
     DOMAIN,
@@ -22,14 +26,61 @@ from .const import (
     GAME_STATUS_PLAYING,
     GAME_STATUS_SETUP,
 )
-from .ee_api import EEAPIClient, EEAPIError
+from .ee_api import EEAPIClient, EEAPIError, EETimeoutError
 from .sacn_listener import SACNListener
+from .ssh_manager import ssh_kwargs_from_config
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Minimum change (fraction of full scale) on any sACN channel before entities are notified
+SACN_CHANGE_THRESHOLD = 0.005
+
+# Max concurrent exec.lua requests per poll (EE serves Lua on its game thread)
+MAX_CONCURRENT_REQUESTS = 5
+
+# async_request_refresh calls (services, switch, buttons, sACN) within this window share one refresh,
+# sent after the window so EE has settled
+REQUEST_REFRESH_COOLDOWN = 1.5
+
+# Shared read-only fallback for primary_ship when no ship data is available
+_EMPTY: dict[str, Any] = {}
+
+
+class EmptyEpsilonSACNCoordinator(DataUpdateCoordinator[dict[str, float]]):
+    """Push-only coordinator for sACN real-time data (hull, shields, energy, ...); never polls."""
+
+    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+        self._config = config
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_sacn",
+            update_interval=None,
+        )
+        self._listener = SACNListener(universe=config.get(CONF_SACN_UNIVERSE, 2))
+        self.data = self._listener.get_data()
+
+    @property
+    def listener(self) -> SACNListener:
+        return self._listener
+
+    @callback
+    def async_push(self, sacn_data: dict[str, float]) -> bool:
+        """Publish a decoded frame if any channel moved past the threshold. Returns True if published."""
+        current = self.data
+        if current and all(
+            abs(value - current.get(name, 0.0)) <= SACN_CHANGE_THRESHOLD
+            for name, value in sacn_data.items()
+        ):
+            return False
+        self.async_set_updated_data(sacn_data)
+        return True
+
 
 class EmptyEpsilonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Combines sACN real-time data with HTTP API polled data."""
+    """Polls the EE HTTP API; owns the sACN coordinator for the real-time entities."""
 
     def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
         self._config = config
@@ -43,16 +94,32 @@ class EmptyEpsilonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=poll_interval),
+            # Data is a plain dict of primitives: skip listener callbacks/state writes when a poll changes nothing
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
-        self._sacn: SACNListener | None = None
-        universe = config.get(CONF_SACN_UNIVERSE, 2)
-        self._sacn = SACNListener(universe=universe)
+        self._sacn_coordinator = EmptyEpsilonSACNCoordinator(hass, config)
+        self._request_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Read once; the exec_lua service checks this on every call
+        self.exec_lua_enabled: bool = bool(config.get(CONF_ENABLE_EXEC_LUA, True))
         self._last_scenario_time: float | None = None
         self._last_scenario_time_at: float = 0.0
         self._last_inferred_paused: bool | None = None  # Persist when uncertain
         self._running_count: int = 0  # Consecutive "running" samples for hysteresis
         self._last_sacn_refresh_at: float = 0.0
         self._sacn_refresh_interval: float = 2.0  # Min seconds between sACN-triggered HTTP polls
+        # Sub-dict of self.data, resolved once per update so entities skip the .get("http", {}) chains
+        self.http: dict[str, Any] = {}
+        self.primary_ship: dict[str, Any] = _EMPTY
+        self.paused: bool = False
+        # Polls started so far, and which of them produced self.data (lets entities spot stale results)
+        self.fetch_seq: int = 0
+        self.data_seq: int = 0
 
     def _infer_paused(self, scenario_time: float | None) -> bool:
         """Infer paused when scenario time does not advance (EE getGameSpeed returns nil in headless)."""
@@ -93,24 +160,34 @@ class EmptyEpsilonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def api(self) -> EEAPIClient:
         return self._api
 
+    @cached_property
+    def ssh_kwargs(self) -> dict[str, Any]:
+        """SSHManager keyword arguments for this instance (config is fixed for the coordinator's lifetime)."""
+        return ssh_kwargs_from_config(self._config)
+
     @property
-    def sacn_listener(self) -> SACNListener | None:
-        return self._sacn
+    def sacn_coordinator(self) -> EmptyEpsilonSACNCoordinator:
+        return self._sacn_coordinator
 
-    @callback
-    def _push_sacn_only(self, sacn_data: dict[str, float]) -> None:
-        """Update sACN data and notify listeners immediately (no HTTP poll)."""
-        if self.data is not None and isinstance(self.data, dict):
-            self.data["sacn"] = sacn_data
-            self.async_update_listeners()
+    @property
+    def sacn_listener(self) -> SACNListener:
+        return self._sacn_coordinator.listener
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Merge sACN data with HTTP API data."""
-        data: dict[str, Any] = {"sacn": {}, "http": {}, "game_status": None}
+    @property
+    def sacn(self) -> dict[str, float]:
+        """Latest decoded sACN data."""
+        return self._sacn_coordinator.data
+
+    async def _limited(self, coro: Awaitable[_T]) -> _T:
+        """Await coro while holding one of the MAX_CONCURRENT_REQUESTS slots."""
+        async with self._request_limit:
+            return await coro
 
-        # Latest sACN (real-time)
-        if self._sacn:
-            data["sacn"] = self._sacn.get_data()
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Poll HTTP API data (sACN is pushed separately via sacn_coordinator)."""
+        self.fetch_seq += 1
+        fetch_seq = self.fetch_seq
+        data: dict[str, Any] = {"http": {}, "game_status": None}
 
         # HTTP API (game status, player count, scenario time, paused)
         try:
@@ -119,22 +196,39 @@ class EmptyEpsilonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data["http"]["server_reachable"] = True
 
             if has_game:
-                scenario_time = await self._api.get_scenario_time()
+                # Independent queries: run concurrently so the poll costs ~one round-trip
+                (
+                    scenario_time,
+                    player_ship_count,
+                    paused_api,
+                    victory,
+                    total_objects,
+                    enemy_ship_count,
+                    friendly_station_count,
+                    primary_ship,
+                ) = await asyncio.gather(
+                    self._limited(self._api.get_scenario_time()),
+                    self._limited(self._api.get_player_ship_count()),
+                    self._limited(self._api.is_paused()),
+                    self._limited(self._api.get_victory_faction()),
+                    self._limited(self._api.get_total_objects()),
+                    self._limited(self._api.get_enemy_ship_count()),
+                    self._limited(self._api.get_friendly_station_count()),
+                    self._limited(self._api.get_primary_ship_info()),
+                )
                 data["http"]["scenario_time"] = scenario_time
-                data["http"]["player_ship_count"] = await self._api.get_player_ship_count()
+                data["http"]["player_ship_count"] = player_ship_count
                 # Try is_paused() first; fall back to inferring from scenario time when getGameSpeed is nil in headless
-                paused_api = await self._api.is_paused()
                 data["http"]["paused"] = paused_api if paused_api else self._infer_paused(scenario_time)
-                victory = await self._api.get_victory_faction()
                 data["http"]["victory_faction"] = victory
                 if victory:
                     _LOGGER.debug("get_victory_faction returned %r (game over)", victory)
 
                 # Phase 2: server-level and primary ship sensors
-                data["http"]["total_objects"] = await self._api.get_total_objects()
-                data["http"]["enemy_ship_count"] = await self._api.get_enemy_ship_count()
-                data["http"]["friendly_station_count"] = await self._api.get_friendly_station_count()
-                data["http"]["primary_ship"] = await self._api.get_primary_ship_info()
+                data["http"]["total_objects"] = total_objects
+                data["http"]["enemy_ship_count"] = enemy_ship_count
+                data["http"]["friendly_station_count"] = friendly_station_count
+                data["http"]["primary_ship"] = primary_ship
 
                 # Derive game_status
                 if victory:
@@ -162,6 +256,9 @@ class EmptyEpsilonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 data["http"]["friendly_station_count"] = 0
                 data["http"]["primary_ship"] = {}
 
+        except EETimeoutError as e:
+            # Only get_has_game lets timeouts through; keep the last data rather than report setup
+            raise UpdateFailed(f"EmptyEpsilon did not answer: {e}") from e
         except EEAPIError as e:
             _LOGGER.warning("HTTP API update failed: %s (raw=%s)", e, getattr(e, "raw", None))
             data["http"]["server_reachable"] = False
@@ -173,25 +270,27 @@ class EmptyEpsilonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data["http"]["server_reachable"] = False
             raise UpdateFailed from e
 
+        self.data_seq = fetch_seq
+        self.http = data["http"]
+        self.primary_ship = self.http.get("primary_ship") or _EMPTY
+        self.paused = bool(self.http.get("paused"))
         return data
 
     async def start_sacn(self) -> None:
-        """Start sACN listener and wire callback to request refresh."""
-        if not self._sacn:
-            return
-        # Fast path: push sACN to entities immediately (~50ms) for hull, shields, etc.
+        """Start sACN listener and wire it to the sACN coordinator."""
+        listener = self._sacn_coordinator.listener
+        # Fast path: push sACN to its entities immediately for hull, shields, etc.
         # Slow path: full HTTP refresh throttled so pause detection and game status work
         def on_sacn_data(sacn_data: dict) -> None:
-            self._push_sacn_only(sacn_data)
+            self._sacn_coordinator.async_push(sacn_data)
             now = time.monotonic()
             if now - self._last_sacn_refresh_at >= self._sacn_refresh_interval:
                 self._last_sacn_refresh_at = now
                 self.hass.async_create_task(self.async_request_refresh())
 
-        self._sacn.set_callback(on_sacn_data)
-        await self._sacn.start()
+        listener.set_callback(on_sacn_data)
+        await listener.start()
 
     def stop_sacn(self) -> None:
         """Stop sACN listener."""
-        if self._sacn:
-            self._sacn.stop()
+        self._sacn_coordinator.listener.stop()
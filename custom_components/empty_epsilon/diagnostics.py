@@ -46,5 +46,6 @@ async def async_get_config_entry_diagnostics(
     if coordinator:
         data["last_update_success"] = coordinator.last_update_success
         data["coordinator_data"] = coordinator.data
+        data["sacn_data"] = coordinator.sacn
 
     return data
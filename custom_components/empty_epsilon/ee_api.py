@@ -11,6 +11,15 @@ from .const import EE_EXEC_PATH
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per-call timeouts (s): cheap status queries fail fast, heavy scripts get more room
+POLL_TIMEOUT = 2.0
+SCRIPT_TIMEOUT = 10.0
+# The has-game probe decides between "game running" and "setup"; give it more room than bulk polls
+HAS_GAME_TIMEOUT = 5.0
+
+# Escape backslashes and double quotes for embedding in a Lua "..." string (single pass)
+_LUA_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 class EEAPIError(Exception):
     """Error from EE HTTP API."""
@@ -20,6 +29,10 @@ class EEAPIError(Exception):
         self.raw = raw
 
 
+class EETimeoutError(EEAPIError):
+    """EE did not answer within the request timeout."""
+
+
 class EEAPIClient:
     """Client for EmptyEpsilon HTTP API via POST /exec.lua."""
 
@@ -30,9 +43,10 @@ class EEAPIClient:
     def _url(self, path: str) -> str:
         return f"{self._base_url}{path}"
 
-    async def exec_lua(self, lua_code: str) -> str:
+    async def exec_lua(self, lua_code: str, timeout: float | None = None) -> str:
         """
         Execute Lua code on the EE server. Returns the result as string.
+        timeout overrides the client's default total timeout for this call.
         Raises EEAPIError on API error or no game.
         """
         url = self._url(EE_EXEC_PATH)
@@ -43,6 +57,7 @@ class EEAPIClient:
                     url,
                     data=lua_code,
                     headers={"Content-Type": "text/plain; charset=utf-8"},
+                    timeout=aiohttp.ClientTimeout(total=timeout) if timeout is not None else self._timeout,
                 ) as resp:
                     text = await resp.text()
                     _LOGGER.debug("exec_lua response status=%s len=%d body=%s", resp.status, len(text), repr(text[:200]))
@@ -61,11 +76,15 @@ class EEAPIClient:
             except aiohttp.ClientError as e:
                 _LOGGER.warning("HTTP request failed to %s: %s", url, e)
                 raise EEAPIError(str(e)) from e
+            except TimeoutError as e:
+                # aiohttp's total timeout is not a ClientError; surface it like any other failed query
+                _LOGGER.debug("HTTP request to %s timed out", url)
+                raise EETimeoutError(f"Timed out: {lua_code[:80]}") from e
 
     async def get_scenario_time(self) -> float | None:
         """Return scenario time in seconds or None if no game."""
         try:
-            r = await self.exec_lua("return tostring(getScenarioTime() or '')")
+            r = await self.exec_lua("return tostring(getScenarioTime() or '')", timeout=POLL_TIMEOUT)
             return float(r) if r and r.strip() else None
         except (EEAPIError, ValueError):
             return None
@@ -74,11 +93,15 @@ class EEAPIClient:
         """Return True if a game is running (scenario time and player ship exist)."""
         try:
             r = await self.exec_lua(
-                "return tostring(getScenarioTime() ~= nil and getPlayerShip(-1) ~= nil)"
+                "return tostring(getScenarioTime() ~= nil and getPlayerShip(-1) ~= nil)",
+                timeout=HAS_GAME_TIMEOUT,
             )
             raw = (r or "").strip().strip('"\'')
             result = raw.lower() == "true"
             return result
+        except EETimeoutError:
+            # Slow is not "no game": let the coordinator keep its last data
+            raise
         except EEAPIError as e:
             _LOGGER.debug("get_has_game failed: %s (raw=%s)", e, getattr(e, "raw", None))
             return False
@@ -88,7 +111,8 @@ class EEAPIClient:
         try:
             r = await self.exec_lua(
                 "local n=0; for i=0,99 do if getPlayerShip(i) then n=n+1 end end; "
-                "if n==0 and getPlayerShip(-1) then n=1 end; return tostring(n)"
+                "if n==0 and getPlayerShip(-1) then n=1 end; return tostring(n)",
+                timeout=POLL_TIMEOUT,
             )
             return int(float(r.strip())) if r and r.strip() else 0
         except (EEAPIError, ValueError):
@@ -98,7 +122,8 @@ class EEAPIClient:
         """Return winning faction name or None if game not over."""
         try:
             r = await self.exec_lua(
-                "local g=gameGlobalInfo; if g then return tostring(g:getVictoryFaction() or '') end; return ''"
+                "local g=gameGlobalInfo; if g then return tostring(g:getVictoryFaction() or '') end; return ''",
+                timeout=POLL_TIMEOUT,
             )
             raw = (r or "").strip().strip('"\'')
             # Treat nil, null, none, empty as "game not over"
@@ -115,7 +140,8 @@ class EEAPIClient:
             r = await self.exec_lua(
                 "if getGameSpeed then return tostring(getGameSpeed()==0) end; "
                 "local g=gameGlobalInfo; if g and g.getGameSpeed then return tostring(g:getGameSpeed()==0) end; "
-                "return 'false'"
+                "return 'false'",
+                timeout=POLL_TIMEOUT,
             )
             s = (r or "").strip().lower().strip('"\'')
             return s == "true"
@@ -132,20 +158,23 @@ class EEAPIClient:
 
     async def shutdown_game(self) -> None:
         """Request graceful shutdown via EE shutdownGame(). Exits the process cleanly."""
-        await self.exec_lua("shutdownGame()")
+        await self.exec_lua("shutdownGame()", timeout=SCRIPT_TIMEOUT)
 
     # --- Phase 3: Game controls ---
+    # Game control methods return True once the command was sent, False if there was nothing to send
 
-    async def global_message(self, message: str) -> None:
+    async def global_message(self, message: str) -> bool:
         """Display a message to all players."""
         # Escape quotes in message for Lua string
-        escaped = (message or "").replace("\\", "\\\\").replace('"', '\\"')
+        escaped = (message or "").translate(_LUA_ESCAPE)
         await self.exec_lua(f'globalMessage("{escaped}")')
+        return True
 
-    async def victory(self, faction: str) -> None:
+    async def victory(self, faction: str) -> bool:
         """End the game with the specified faction as winner."""
-        escaped = (faction or "Human Navy").replace("\\", "\\\\").replace('"', '\\"')
+        escaped = (faction or "Human Navy").translate(_LUA_ESCAPE)
         await self.exec_lua(f'victory("{escaped}")')
+        return True
 
     async def spawn_player_ship(
         self,
@@ -154,19 +183,20 @@ class EEAPIClient:
         faction: str = "Human Navy",
         x: float = 0,
         y: float = 0,
-    ) -> None:
+    ) -> bool:
         """Spawn a player ship. Template examples: Atlantis, Phobos M3P, Player Cruiser."""
-        t = (template or "Atlantis").replace("\\", "\\\\").replace('"', '\\"')
-        c = (callsign or "Epsilon").replace("\\", "\\\\").replace('"', '\\"')
-        f = (faction or "Human Navy").replace("\\", "\\\\").replace('"', '\\"')
+        t = (template or "Atlantis").translate(_LUA_ESCAPE)
+        c = (callsign or "Epsilon").translate(_LUA_ESCAPE)
+        f = (faction or "Human Navy").translate(_LUA_ESCAPE)
         await self.exec_lua(
             f'PlayerSpaceship():setFaction("{f}"):setTemplate("{t}"):setCallSign("{c}"):setPosition({x},{y})'
         )
+        return True
 
     # --- Phase 5: Advanced GM controls ---
 
     def _escape(self, s: str) -> str:
-        return (s or "").replace("\\", "\\\\").replace('"', '\\"')
+        return (s or "").translate(_LUA_ESCAPE)
 
     async def spawn_cpu_ship(
         self,
@@ -175,7 +205,7 @@ class EEAPIClient:
         x: float = 0,
         y: float = 0,
         order: str = "idle",
-    ) -> None:
+    ) -> bool:
         """Spawn an AI CpuShip. Order: idle, roam, attack (needs target)."""
         t, f = self._escape(template or "Adder MK3"), self._escape(faction or "Kraylor")
         base = f'CpuShip():setFaction("{f}"):setTemplate("{t}"):setPosition({x},{y})'
@@ -183,6 +213,7 @@ class EEAPIClient:
             await self.exec_lua(base + ":orderRoaming()")
         else:
             await self.exec_lua(base + ":orderIdle()")
+        return True
 
     async def spawn_station(
         self,
@@ -190,30 +221,34 @@ class EEAPIClient:
         faction: str = "Human Navy",
         x: float = 0,
         y: float = 0,
-    ) -> None:
+    ) -> bool:
         """Spawn a SpaceStation."""
         t, f = self._escape(template or "Small Station"), self._escape(faction or "Human Navy")
         await self.exec_lua(
             f'SpaceStation():setFaction("{f}"):setTemplate("{t}"):setPosition({x},{y})'
         )
+        return True
 
-    async def spawn_nebula(self, x: float = 0, y: float = 0) -> None:
+    async def spawn_nebula(self, x: float = 0, y: float = 0) -> bool:
         """Spawn a nebula at position."""
         await self.exec_lua(f"Nebula():setPosition({x},{y})")
+        return True
 
-    async def spawn_asteroid(self, x: float = 0, y: float = 0) -> None:
+    async def spawn_asteroid(self, x: float = 0, y: float = 0) -> bool:
         """Spawn an asteroid at position."""
         await self.exec_lua(f"Asteroid():setPosition({x},{y})")
+        return True
 
-    async def send_comms_message(self, callsign: str, message: str) -> None:
+    async def send_comms_message(self, callsign: str, message: str) -> bool:
         """Send an incoming comms message to a player ship by callsign."""
         c, m = self._escape(callsign), self._escape(message)
         await self.exec_lua(
             f'for i=-1,99 do local s=getPlayerShip(i); if s and s:getCallSign()=="{c}" then '
             f's:addCustomMessage("gm","{m}"); break end end'
         )
+        return True
 
-    async def modify_hull(self, callsign: str, value: float) -> None:
+    async def modify_hull(self, callsign: str, value: float) -> bool:
         """Set hull percentage (0-100) for a player ship."""
         c = self._escape(callsign)
         v = max(0, min(100, float(value)))
@@ -221,8 +256,9 @@ class EEAPIClient:
             f'for i=-1,99 do local s=getPlayerShip(i); if s and s:getCallSign()=="{c}" then '
             f's:setHull({v}); break end end'
         )
+        return True
 
-    async def modify_shields(self, callsign: str, front: float, rear: float) -> None:
+    async def modify_shields(self, callsign: str, front: float, rear: float) -> bool:
         """Set shield percentages (0-100) for a player ship."""
         c = self._escape(callsign)
         f, r = max(0, min(100, float(front))), max(0, min(100, float(rear)))
@@ -230,6 +266,7 @@ class EEAPIClient:
             f'for i=-1,99 do local s=getPlayerShip(i); if s and s:getCallSign()=="{c}" then '
             f's:setShields({f},{r}); break end end'
         )
+        return True
 
     async def give_weapons(
         self,
@@ -239,7 +276,7 @@ class EEAPIClient:
         emp: int = 0,
         mine: int = 0,
         hvli: int = 0,
-    ) -> None:
+    ) -> bool:
         """Add ammo to a player ship. Pass counts to add."""
         c = self._escape(callsign)
         updates = []
@@ -247,35 +284,41 @@ class EEAPIClient:
             if count:
                 updates.append(f's:setWeaponStorage("{name}", (s:getWeaponStorage("{name}") or 0)+{count})')
         if not updates:
-            return
+            return False
         lua = f'for i=-1,99 do local s=getPlayerShip(i); if s and s:getCallSign()=="{c}" then {" ".join(updates)}; break end end'
         await self.exec_lua(lua)
+        return True
 
-    async def red_alert_all(self) -> None:
+    async def red_alert_all(self) -> bool:
         """Set all player ships to red alert."""
         await self.exec_lua(
             'for i=-1,99 do local s=getPlayerShip(i); if s then s:setAlertLevel("RED ALERT"); end end'
         )
+        return True
 
-    async def resupply_all(self) -> None:
+    async def resupply_all(self) -> bool:
         """Refill energy and ammo for all player ships."""
         await self.exec_lua(
             "for i=-1,99 do local s=getPlayerShip(i); if s then "
             "s:setEnergyLevel(s:getEnergyLevelMax()); "
             "for _,w in ipairs({'Homing','Nuke','EMP','Mine','HVLI'}) do "
             "local m=s:getWeaponStorageMax(w); if m and m>0 then s:setWeaponStorage(w,m) end end "
-            "end end"
+            "end end",
+            timeout=SCRIPT_TIMEOUT,
         )
+        return True
 
-    async def repair_all(self) -> None:
+    async def repair_all(self) -> bool:
         """Restore hull and shields for all player ships."""
         await self.exec_lua(
             "for i=-1,99 do local s=getPlayerShip(i); if s then "
             "s:setHull(s:getHullMax() or 100); "
             "local fm=s:getShieldMax(0); local rm=s:getShieldMax(1); "
             "s:setShields(fm and fm or 100, rm and rm or 100); "
-            "end end"
+            "end end",
+            timeout=SCRIPT_TIMEOUT,
         )
+        return True
 
     # --- Phase 2: Server-level and primary ship sensors ---
 
@@ -283,7 +326,8 @@ class EEAPIClient:
         """Return count of all game objects."""
         try:
             r = await self.exec_lua(
-                "local t=getAllObjects() or {}; return tostring(#t)"
+                "local t=getAllObjects() or {}; return tostring(#t)",
+                timeout=POLL_TIMEOUT,
             )
             return int(float(r.strip())) if r and r.strip() else 0
         except (EEAPIError, ValueError):
@@ -295,7 +339,8 @@ class EEAPIClient:
             r = await self.exec_lua(
                 "local p=getPlayerShip(-1); if not p then return '0' end; "
                 "local n=0; for _,o in ipairs(getAllObjects() or {}) do "
-                "if o.typeName=='CpuShip' and p:isEnemy(o) then n=n+1 end end; return tostring(n)"
+                "if o.typeName=='CpuShip' and p:isEnemy(o) then n=n+1 end end; return tostring(n)",
+                timeout=POLL_TIMEOUT,
             )
             return int(float(r.strip())) if r and r.strip() else 0
         except (EEAPIError, ValueError):
@@ -307,7 +352,8 @@ class EEAPIClient:
             r = await self.exec_lua(
                 "local p=getPlayerShip(-1); if not p then return '0' end; "
                 "local n=0; for _,o in ipairs(getAllObjects() or {}) do "
-                "if o.typeName=='SpaceStation' and p:isFriendly(o) then n=n+1 end end; return tostring(n)"
+                "if o.typeName=='SpaceStation' and p:isFriendly(o) then n=n+1 end end; return tostring(n)",
+                timeout=POLL_TIMEOUT,
             )
             return int(float(r.strip())) if r and r.strip() else 0
         except (EEAPIError, ValueError):
@@ -336,7 +382,8 @@ class EEAPIClient:
                 "local e=s:getWeaponStorage('EMP') or 0; local m=s:getWeaponStorage('Mine') or 0; "
                 "local v=s:getWeaponStorage('HVLI') or 0; "
                 "local rep=0; if s.getReputationPoints then rep=s:getReputationPoints() or 0 end; "
-                "return c..'|'..t..'|'..sec..'|'..tostring(h)..'|'..tostring(n)..'|'..tostring(e)..'|'..tostring(m)..'|'..tostring(v)..'|'..tostring(rep)"
+                "return c..'|'..t..'|'..sec..'|'..tostring(h)..'|'..tostring(n)..'|'..tostring(e)..'|'..tostring(m)..'|'..tostring(v)..'|'..tostring(rep)",
+                timeout=POLL_TIMEOUT,
             )
             if not r or "|" not in r:
                 return result
@@ -29,14 +29,12 @@ class EmptyEpsilonEntity(Entity):
         self._attr_unique_id = f"{config_entry_id}_{key}"
         if icon:
             self._attr_icon = icon
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry_id)},
+        config = coordinator._config
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry_id)},
             name="EmptyEpsilon",
             manufacturer="Empty Epsilon",
-            configuration_url=f"http://{self.coordinator._config.get('ee_host', '')}:{self.coordinator._config.get('ee_port', 8080)}",
+            configuration_url=f"http://{config.get('ee_host', '')}:{config.get('ee_port', 8080)}",
         )
 
     @property
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
+import struct
 from typing import Callable
 
 from .const import (
@@ -16,11 +18,13 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 SACN_PORT = 5568
-
-
-def _decode_dmx_value(raw: int, min_out: float, max_out: float) -> float:
-    """DMX channel is 0-255; map to min_out..max_out."""
-    return min_out + (raw / 255.0) * (max_out - min_out)
+# E1.31 framing layer: universe is a big-endian uint16 at byte 113; DMX data starts at byte 126
+_E131_UNIVERSE_OFFSET = 113
+_E131_MIN_LENGTH = 126
+# Decode at most this often (s); EE sends ~20 Hz but HA state doesn't need every frame
+SACN_MIN_INTERVAL = 0.2
+# Kernel receive buffer so bursts (several senders/universes) aren't dropped
+SACN_RCVBUF_BYTES = 1 << 20
 
 
 class _SACNUDPProtocol(asyncio.DatagramProtocol):
@@ -51,13 +55,25 @@ class SACNListener:
         self,
         universe: int = DEFAULT_SACN_UNIVERSE,
         channels: int = DEFAULT_SACN_CHANNELS,
+        min_interval: float = SACN_MIN_INTERVAL,
     ) -> None:
         self._universe = universe
         self._channels = channels
+        self._min_interval = min_interval
         self._data: dict[str, float] = {name: 0.0 for name in SACN_CHANNEL_NAMES}
-        self._lock = asyncio.Lock()
+        # (dmx_index_0based, min_out, max_out - min_out, name) per channel; DMX 0-255 maps to min_out..max_out
+        self._decode_spec: tuple[tuple[int, float, float, str], ...] = tuple(
+            (ch - 1, min_out, max_out - min_out, name)
+            for (ch, _ee_var, _min_in, _max_in, min_out, max_out), name in zip(
+                SACN_CHANNEL_SPEC, SACN_CHANNEL_NAMES
+            )
+        )
         self._transport: asyncio.DatagramTransport | None = None
         self._callback: Callable[[dict[str, float]], None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Newest raw packet for our universe; older frames in the same window are dropped
+        self._latest_raw: bytes | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     def set_callback(self, callback: Callable[[dict[str, float]], None] | None) -> None:
         """Set optional callback for each received packet (dict of channel name -> value)."""
@@ -68,7 +84,22 @@ class SACNListener:
         return dict(self._data)
 
     def _on_datagram(self, data: bytes) -> None:
-        """Parse sACN packet and process if universe matches. Called from protocol."""
+        """Keep the newest packet for our universe and schedule one decode. Called from protocol."""
+        if len(data) < _E131_MIN_LENGTH:
+            return
+        universe = int.from_bytes(data[_E131_UNIVERSE_OFFSET:_E131_UNIVERSE_OFFSET + 2], "big")
+        if universe != self._universe:
+            return
+        self._latest_raw = data
+        if self._flush_handle is None and self._loop is not None:
+            self._flush_handle = self._loop.call_later(self._min_interval, self._flush)
+
+    def _flush(self) -> None:
+        """Decode the newest buffered packet (at most once per min_interval)."""
+        self._flush_handle = None
+        data, self._latest_raw = self._latest_raw, None
+        if data is None:
+            return
         try:
             from sacn.messages.data_packet import DataPacket
 
@@ -76,25 +107,19 @@ class SACNListener:
         except (ImportError, TypeError, IndexError) as e:
             _LOGGER.debug("sACN parse failed: %s", e)
             return
-        dmx_data = list(packet.dmxData)
-        asyncio.create_task(self._packet_received(packet.universe, dmx_data))
+        self._packet_received(list(packet.dmxData))
 
-    async def _packet_received(self, universe: int, dmx: list[int]) -> None:
-        """Process one sACN packet."""
-        if universe != self._universe:
-            return
+    def _packet_received(self, dmx: list[int]) -> None:
+        """Process one sACN packet (universe already checked from the header in _on_datagram)."""
         new_data = {}
-        for (ch_0based, _ee_var, _min_in, _max_in, min_out, max_out), name in zip(
-            SACN_CHANNEL_SPEC, SACN_CHANNEL_NAMES
-        ):
-            if ch_0based <= len(dmx):
-                raw = dmx[ch_0based - 1]
-                val = _decode_dmx_value(raw, min_out, max_out)
-                new_data[name] = val
+        n = len(dmx)
+        for ch_i, min_out, span, name in self._decode_spec:
+            if ch_i < n:
+                new_data[name] = min_out + (dmx[ch_i] / 255.0) * span
         if not new_data:
             return
-        async with self._lock:
-            self._data.update(new_data)
+        # Single writer on the event loop; get_data() copies, so no lock is needed
+        self._data.update(new_data)
         if self._callback:
             try:
                 self._callback(self.get_data())
@@ -110,19 +135,45 @@ class SACNListener:
             return
 
         loop = asyncio.get_running_loop()
+        self._loop = loop
         transport, _ = await loop.create_datagram_endpoint(
             lambda: _SACNUDPProtocol(self),
             local_addr=("0.0.0.0", SACN_PORT),
+            reuse_port=hasattr(socket, "SO_REUSEPORT") or None,
         )
         self._transport = transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            self._configure_socket(sock)
         _LOGGER.info(
             "sACN listener started on port %s (universe %s, broadcast + multicast)",
             SACN_PORT,
             self._universe,
         )
 
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """Enlarge the receive buffer and join the universe's E1.31 multicast group."""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SACN_RCVBUF_BYTES)
+        except OSError as e:
+            _LOGGER.debug("sACN SO_RCVBUF not applied: %s", e)
+        # E1.31 multicast address is 239.255.<universe high byte>.<universe low byte>
+        group = f"239.255.{(self._universe >> 8) & 0xFF}.{self._universe & 0xFF}"
+        try:
+            sock.setsockopt(
+                socket.IPPROTO_IP,
+                socket.IP_ADD_MEMBERSHIP,
+                struct.pack("4s4s", socket.inet_aton(group), socket.inet_aton("0.0.0.0")),
+            )
+        except OSError as e:
+            _LOGGER.debug("sACN multicast join %s failed (broadcast still works): %s", group, e)
+
     def stop(self) -> None:
         """Stop the listener."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._latest_raw = None
         if self._transport:
             self._transport.close()
             self._transport = None
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -20,21 +22,70 @@ from .coordinator import EmptyEpsilonCoordinator
 from .entity import EmptyEpsilonEntity
 
 
-def _game_status_native_value(status: str | None) -> str:
-    if not status:
-        return GAME_STATUS_SETUP
-    return status
-
-
 def _sensor_state(value, decimals: int = 0) -> float | None:
     if value is None:
         return None
+    # Common cases first; only strings and other types pay for the try/except
+    if type(value) is float:
+        return round(value, decimals)
+    if type(value) is int:
+        return float(value)
     try:
         return round(float(value), decimals)
     except (TypeError, ValueError):
         return None
 
 
+def _safe_int(value) -> int:
+    """Ammo/reputation as int; non-numeric strings become 0."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(value) if str(value).isdigit() else 0
+
+
+def _str_to_int(value: str) -> int:
+    return int(value) if value.isdigit() else 0
+
+
+# Int converter per value type; a numeric sensor re-picks only when the type it sees changes
+_INT_CONVERTERS: dict[type, Callable[[Any], int]] = {int: int, float: int, str: _str_to_int}
+
+
+# Server-level counters from HTTP: (key, name, unit, icon)
+_HTTP_SPECS: tuple[tuple[str, str, str, str], ...] = (
+    ("total_objects", "Total objects", "objects", "mdi:counter"),
+    ("enemy_ship_count", "Enemy ships", "ships", "mdi:target"),
+    ("friendly_station_count", "Friendly stations", "stations", "mdi:domain"),
+)
+
+# Primary ship from HTTP: (key, name, numeric, icon)
+_PRIMARY_SHIP_SPECS: tuple[tuple[str, str, bool, str], ...] = (
+    ("callsign", "Callsign", False, "mdi:badge-account"),
+    ("ship_type", "Ship type", False, "mdi:ship-wheel"),
+    ("sector", "Sector", False, "mdi:map-marker"),
+    ("homing", "Homing missiles", True, "mdi:missile"),
+    ("nuke", "Nukes", True, "mdi:atom"),
+    ("emp", "EMPs", True, "mdi:flash"),
+    ("mine", "Mines", True, "mdi:land-mine-on"),
+    ("hvli", "HVLIs", True, "mdi:bullet"),
+    ("reputation", "Reputation", True, "mdi:star"),
+)
+
+# Primary ship percentages from sACN: (key, name)
+_SACN_PERCENT_SPECS: tuple[tuple[str, str], ...] = (
+    ("hull", "Hull"),
+    ("frontShield", "Front shields"),
+    ("rearShield", "Rear shields"),
+    ("energy", "Energy"),
+)
+
+# Other primary ship channels from sACN: (key, name, unit, min, max)
+_SACN_SPECS: tuple[tuple[str, str, str | None, float, float], ...] = (
+    ("impulse", "Impulse", None, 0, 100),
+    ("warp", "Warp", None, 0, 100),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -42,135 +93,57 @@ async def async_setup_entry(
 ) -> None:
     """Set up EmptyEpsilon sensors from a config entry."""
     coordinator: EmptyEpsilonCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    config = config_entry.data
     entry_id = config_entry.entry_id
+    # sACN sensors are pushed by the sACN coordinator
+    sacn_coordinator = coordinator.sacn_coordinator
 
-    entities: list[SensorEntity] = []
-
-    # Game status (required)
-    entities.append(
-        EmptyEpsilonGameStatusSensor(coordinator, entry_id, "game_status", "Game status")
-    )
-    entities.append(
+    entities: list[SensorEntity] = [
+        EmptyEpsilonGameStatusSensor(coordinator, entry_id, "game_status", "Game status"),
         EmptyEpsilonPlayerShipCountSensor(
             coordinator, entry_id, "player_ship_count", "Player ship count"
-        )
-    )
-
-    # Server-level from HTTP
-    entities.append(
-        EmptyEpsilonScenarioTimeSensor(
-            coordinator, entry_id, "scenario_time", "Scenario time"
-        )
-    )
-    entities.append(
-        EmptyEpsilonSensor(
-            coordinator, entry_id, "total_objects", "Total objects",
-            unit="objects", icon="mdi:counter", state_class=SensorStateClass.MEASUREMENT
-        )
-    )
-    entities.append(
+        ),
+        EmptyEpsilonScenarioTimeSensor(coordinator, entry_id, "scenario_time", "Scenario time"),
+    ]
+    entities.extend(
         EmptyEpsilonSensor(
-            coordinator, entry_id, "enemy_ship_count", "Enemy ships",
-            unit="ships", icon="mdi:target", state_class=SensorStateClass.MEASUREMENT
-        )
-    )
-    entities.append(
-        EmptyEpsilonSensor(
-            coordinator, entry_id, "friendly_station_count", "Friendly stations",
-            unit="stations", icon="mdi:domain", state_class=SensorStateClass.MEASUREMENT
-        )
-    )
-
-    # Primary ship from HTTP (callsign, type, sector, ammo)
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "callsign", "Callsign", icon="mdi:badge-account"
-        )
-    )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "ship_type", "Ship type", icon="mdi:ship-wheel"
+            coordinator, entry_id, key, name,
+            unit=unit, icon=icon, state_class=SensorStateClass.MEASUREMENT
         )
+        for key, name, unit, icon in _HTTP_SPECS
     )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "sector", "Sector", icon="mdi:map-marker"
-        )
+    entities.extend(
+        EmptyEpsilonPrimaryShipSensor(coordinator, entry_id, key, name, numeric=numeric, icon=icon)
+        for key, name, numeric, icon in _PRIMARY_SHIP_SPECS
     )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "homing", "Homing missiles",
-            numeric=True, icon="mdi:missile"
-        )
+    entities.extend(
+        EmptyEpsilonSACNPercentSensor(sacn_coordinator, entry_id, key, name)
+        for key, name in _SACN_PERCENT_SPECS
     )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "nuke", "Nukes",
-            numeric=True, icon="mdi:atom"
-        )
-    )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "emp", "EMPs",
-            numeric=True, icon="mdi:flash"
-        )
-    )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "mine", "Mines",
-            numeric=True, icon="mdi:land-mine-on"
-        )
-    )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "hvli", "HVLIs",
-            numeric=True, icon="mdi:bullet"
-        )
-    )
-    entities.append(
-        EmptyEpsilonPrimaryShipSensor(
-            coordinator, entry_id, "reputation", "Reputation",
-            numeric=True, icon="mdi:star"
-        )
-    )
-
-    # Primary ship from sACN (hull, shields, energy, impulse, warp)
-    entities.append(
-        EmptyEpsilonSACNSensor(
-            coordinator, entry_id, "hull", "Hull", PERCENTAGE, 0, 100
-        )
-    )
-    entities.append(
-        EmptyEpsilonSACNSensor(
-            coordinator, entry_id, "frontShield", "Front shields", PERCENTAGE, 0, 100
-        )
-    )
-    entities.append(
-        EmptyEpsilonSACNSensor(
-            coordinator, entry_id, "rearShield", "Rear shields", PERCENTAGE, 0, 100
-        )
-    )
-    entities.append(
-        EmptyEpsilonSACNSensor(
-            coordinator, entry_id, "energy", "Energy", PERCENTAGE, 0, 100
-        )
-    )
-    entities.append(
-        EmptyEpsilonSACNSensor(
-            coordinator, entry_id, "impulse", "Impulse", None, 0, 100
-        )
-    )
-    entities.append(
-        EmptyEpsilonSACNSensor(
-            coordinator, entry_id, "warp", "Warp", None, 0, 100
-        )
+    entities.extend(
+        EmptyEpsilonSACNSensor(sacn_coordinator, entry_id, *spec) for spec in _SACN_SPECS
     )
 
     async_add_entities(entities)
 
 
-class EmptyEpsilonGameStatusSensor(EmptyEpsilonEntity, SensorEntity):
+class EmptyEpsilonSensorEntity(EmptyEpsilonEntity, SensorEntity):
+    """Sensor whose value is computed once per coordinator update into _attr_native_value."""
+
+    def _compute_value(self) -> Any:
+        """Native value for the current coordinator data; subclasses override."""
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        self._attr_native_value = self._compute_value()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_native_value = self._compute_value()
+        self.async_write_ha_state()
+
+
+class EmptyEpsilonGameStatusSensor(EmptyEpsilonSensorEntity):
     """Game status: setup, playing, paused, game_over_victory, game_over_defeat."""
 
     _attr_translation_key = "game_status"
@@ -178,16 +151,15 @@ class EmptyEpsilonGameStatusSensor(EmptyEpsilonEntity, SensorEntity):
     def __init__(self, coordinator, entry_id, key, name):
         super().__init__(coordinator, entry_id, key, name, icon="mdi:gamepad-variant")
 
-    @property
-    def native_value(self) -> str:
-        return _game_status_native_value(self.coordinator.data.get("game_status"))
+    def _compute_value(self) -> str:
+        return self.coordinator.data.get("game_status") or GAME_STATUS_SETUP
 
     @property
     def native_unit_of_measurement(self) -> None:
         return None
 
 
-class EmptyEpsilonPlayerShipCountSensor(EmptyEpsilonEntity, SensorEntity):
+class EmptyEpsilonPlayerShipCountSensor(EmptyEpsilonSensorEntity):
     """Number of active player ships."""
 
     _attr_native_unit_of_measurement = "ships"
@@ -196,13 +168,12 @@ class EmptyEpsilonPlayerShipCountSensor(EmptyEpsilonEntity, SensorEntity):
     def __init__(self, coordinator, entry_id, key, name):
         super().__init__(coordinator, entry_id, key, name, icon="mdi:ship")
 
-    @property
-    def native_value(self) -> int | None:
-        count = self.coordinator.data.get("http", {}).get("player_ship_count")
+    def _compute_value(self) -> int | None:
+        count = self.coordinator.http.get("player_ship_count")
         return int(count) if count is not None else 0
 
 
-class EmptyEpsilonSensor(EmptyEpsilonEntity, SensorEntity):
+class EmptyEpsilonSensor(EmptyEpsilonSensorEntity):
     """Generic sensor reading from coordinator.data['http'][key]."""
 
     def __init__(
@@ -221,9 +192,8 @@ class EmptyEpsilonSensor(EmptyEpsilonEntity, SensorEntity):
         self._state_class = state_class
         self._attr_translation_key = key
 
-    @property
-    def native_value(self) -> str | int | float | None:
-        val = self.coordinator.data.get("http", {}).get(self._key)
+    def _compute_value(self) -> str | int | float | None:
+        val = self.coordinator.http.get(self._key)
         if val is None:
             return None
         if isinstance(val, (int, float)):
@@ -239,7 +209,7 @@ class EmptyEpsilonSensor(EmptyEpsilonEntity, SensorEntity):
         return self._state_class
 
 
-class EmptyEpsilonPrimaryShipSensor(EmptyEpsilonEntity, SensorEntity):
+class EmptyEpsilonPrimaryShipSensor(EmptyEpsilonSensorEntity):
     """Sensor for primary ship data from coordinator.data['http']['primary_ship']."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -256,17 +226,20 @@ class EmptyEpsilonPrimaryShipSensor(EmptyEpsilonEntity, SensorEntity):
         super().__init__(coordinator, entry_id, key, name, icon=icon)
         self._key = key
         self._numeric = numeric
+        self._convert: Callable[[Any], str | int] = _safe_int if numeric else str
+        self._last_kind: type | None = None
         self._attr_translation_key = key
 
-    @property
-    def native_value(self) -> str | int | None:
-        ship = self.coordinator.data.get("http", {}).get("primary_ship") or {}
-        val = ship.get(self._key)
+    def _compute_value(self) -> str | int | None:
+        val = self.coordinator.primary_ship.get(self._key)
         if val is None:
             return None
         if self._numeric:
-            return int(val) if isinstance(val, (int, float)) else (int(val) if str(val).isdigit() else 0)
-        return str(val)
+            kind = type(val)
+            if kind is not self._last_kind:
+                self._last_kind = kind
+                self._convert = _INT_CONVERTERS.get(kind, _safe_int)
+        return self._convert(val)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -277,7 +250,7 @@ class EmptyEpsilonPrimaryShipSensor(EmptyEpsilonEntity, SensorEntity):
         return SensorStateClass.MEASUREMENT if self._numeric else None
 
 
-class EmptyEpsilonScenarioTimeSensor(EmptyEpsilonEntity, SensorEntity):
+class EmptyEpsilonScenarioTimeSensor(EmptyEpsilonSensorEntity):
     """Elapsed scenario time in seconds."""
 
     _attr_device_class = SensorDeviceClass.DURATION
@@ -287,13 +260,23 @@ class EmptyEpsilonScenarioTimeSensor(EmptyEpsilonEntity, SensorEntity):
     def __init__(self, coordinator, entry_id, key, name):
         super().__init__(coordinator, entry_id, key, name, icon="mdi:clock-outline")
 
-    @property
-    def native_value(self) -> float | None:
-        return _sensor_state(self.coordinator.data.get("http", {}).get("scenario_time"), 1)
+    def _compute_value(self) -> float | None:
+        return _sensor_state(self.coordinator.http.get("scenario_time"), 1)
+
+
+class EmptyEpsilonSACNPercentSensor(EmptyEpsilonSensorEntity):
+    """Percentage sensor from an sACN channel (0.0–1.0 shown as 0–100 %)."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _compute_value(self) -> float | None:
+        raw = self.coordinator.data.get(self._key)
+        return None if raw is None else round(raw * 100.0, 1)
 
 
-class EmptyEpsilonSACNSensor(EmptyEpsilonEntity, SensorEntity):
-    """Sensor from sACN channel (0.0–1.0 mapped to native range)."""
+class EmptyEpsilonSACNSensor(EmptyEpsilonSensorEntity):
+    """Sensor from sACN channel (0.0–1.0 mapped to native range); uses the sACN coordinator."""
 
     def __init__(
         self,
@@ -306,24 +289,14 @@ class EmptyEpsilonSACNSensor(EmptyEpsilonEntity, SensorEntity):
         max_val: float,
     ):
         super().__init__(coordinator, entry_id, key, name)
-        self._unit = unit
-        self._min_val = min_val
-        self._max_val = max_val
-
-    @property
-    def native_value(self) -> float | None:
-        sacn = self.coordinator.data.get("sacn", {})
-        raw = sacn.get(self._key)
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = SensorStateClass.MEASUREMENT if unit else None
+        # raw is 0.0–1.0 from sACN; fold the min..max mapping into offset + raw * scale
+        self._offset = min_val
+        self._scale = max_val - min_val
+
+    def _compute_value(self) -> float | None:
+        raw = self.coordinator.data.get(self._key)
         if raw is None:
             return None
-        # raw is 0.0–1.0 from sACN
-        val = self._min_val + raw * (self._max_val - self._min_val)
-        return _sensor_state(val, 1)
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        return self._unit
-
-    @property
-    def state_class(self) -> str | None:
-        return SensorStateClass.MEASUREMENT if self._unit else None
+        return round(self._offset + raw * self._scale, 1)
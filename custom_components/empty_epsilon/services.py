@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Coroutine
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
@@ -19,109 +27,327 @@ from .const import (
     CONF_SCENARIO,
     CONF_SACN_UNIVERSE,
     CONF_SSH_HOST,
-    CONF_SSH_KEY,
-    CONF_SSH_KNOWN_HOSTS,
-    CONF_SSH_PASSWORD,
-    CONF_SSH_PORT,
-    CONF_SSH_SKIP_HOST_KEY_CHECK,
-    CONF_SSH_USERNAME,
     DEFAULT_INIT_SCENARIO,
     DOMAIN,
 )
+from .ee_api import EEAPIClient
 from .ssh_manager import SSHManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connected SSHManagers reused across service calls, keyed by the coordinator's ssh_kwargs items
+_SSH_POOL: dict[tuple[tuple[str, Any], ...], SSHManager] = {}
+_SSH_POOL_LOCK = asyncio.Lock()
+
+# How often pooled connections are checked against SSH_IDLE_TIMEOUT
+_SSH_REAP_INTERVAL = timedelta(seconds=60)
+
+# Shared read-only stand-in for hass.data[DOMAIN] before any entry is loaded
+_NO_ENTRIES: MappingProxyType = MappingProxyType({})
+
+# Entry id when exactly one instance is loaded, so untargeted calls skip the entry scan
+_SINGLE_ENTRY_ID: str | None = None
+
+# Resolved service target (entity_id or device_id) -> config entry id; invalidated on registry updates
+_COORD_CACHE: dict[str, str] = {}
+
+
+# Every service accepts an optional entity_id/device_id to pick the instance
+_TARGET = {
+    vol.Optional("entity_id"): cv.entity_id,
+    vol.Optional("device_id"): str,
+}
+
+_TARGET_SCHEMA = vol.Schema(_TARGET)
+
+_GLOBAL_MESSAGE_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Required("message"): str,
+})
+
+_VICTORY_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Optional("faction", default="Human Navy"): str,
+})
+
+_SPAWN_PLAYER_SHIP_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Optional("template", default="Atlantis"): str,
+    vol.Optional("callsign", default="Epsilon"): str,
+    vol.Optional("faction", default="Human Navy"): str,
+    vol.Optional("x", default=0): vol.Coerce(float),
+    vol.Optional("y", default=0): vol.Coerce(float),
+})
+
+_EXEC_LUA_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Required("code"): str,
+})
+
+_START_SERVER_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Optional("scenario", default=DEFAULT_INIT_SCENARIO): str,
+    vol.Optional("httpserver"): vol.Coerce(int),
+})
+
+_SPAWN_CPU_SHIP_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Optional("template", default="Adder MK3"): str,
+    vol.Optional("faction", default="Kraylor"): str,
+    vol.Optional("x", default=0): vol.Coerce(float),
+    vol.Optional("y", default=0): vol.Coerce(float),
+    vol.Optional("order", default="idle"): vol.In(["idle", "roam"]),
+})
+
+_SPAWN_STATION_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Optional("template", default="Small Station"): str,
+    vol.Optional("faction", default="Human Navy"): str,
+    vol.Optional("x", default=0): vol.Coerce(float),
+    vol.Optional("y", default=0): vol.Coerce(float),
+})
+
+_POSITION_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Optional("x", default=0): vol.Coerce(float),
+    vol.Optional("y", default=0): vol.Coerce(float),
+})
+
+_SEND_COMMS_MESSAGE_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Required("callsign"): str,
+    vol.Required("message"): str,
+})
+
+_MODIFY_HULL_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Required("callsign"): str,
+    vol.Optional("value", default=100): vol.Coerce(float),
+})
+
+_MODIFY_SHIELDS_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Required("callsign"): str,
+    vol.Optional("front", default=100): vol.Coerce(float),
+    vol.Optional("rear", default=100): vol.Coerce(float),
+})
+
+_GIVE_WEAPONS_SCHEMA = vol.Schema({
+    **_TARGET,
+    vol.Required("callsign"): str,
+    vol.Optional("homing", default=0): vol.Coerce(int),
+    vol.Optional("nuke", default=0): vol.Coerce(int),
+    vol.Optional("emp", default=0): vol.Coerce(int),
+    vol.Optional("mine", default=0): vol.Coerce(int),
+    vol.Optional("hvli", default=0): vol.Coerce(int),
+})
+
+# Services that call the EEAPIClient method of the same name with the listed call.data
+# fields and then refresh. The schemas supply defaults and coerce types, so fields are
+# always present and already float/int where the API expects it.
+_API_SERVICES: tuple[tuple[str, tuple[str, ...], vol.Schema], ...] = (
+    ("global_message", ("message",), _GLOBAL_MESSAGE_SCHEMA),
+    ("victory", ("faction",), _VICTORY_SCHEMA),
+    (
+        "spawn_player_ship",
+        ("template", "callsign", "faction", "x", "y"),
+        _SPAWN_PLAYER_SHIP_SCHEMA,
+    ),
+    ("spawn_cpu_ship", ("template", "faction", "x", "y", "order"), _SPAWN_CPU_SHIP_SCHEMA),
+    ("spawn_station", ("template", "faction", "x", "y"), _SPAWN_STATION_SCHEMA),
+    ("spawn_nebula", ("x", "y"), _POSITION_SCHEMA),
+    ("spawn_asteroid", ("x", "y"), _POSITION_SCHEMA),
+    ("send_comms_message", ("callsign", "message"), _SEND_COMMS_MESSAGE_SCHEMA),
+    ("modify_hull", ("callsign", "value"), _MODIFY_HULL_SCHEMA),
+    ("modify_shields", ("callsign", "front", "rear"), _MODIFY_SHIELDS_SCHEMA),
+    (
+        "give_weapons",
+        ("callsign", "homing", "nuke", "emp", "mine", "hvli"),
+        _GIVE_WEAPONS_SCHEMA,
+    ),
+    ("red_alert_all", (), _TARGET_SCHEMA),
+    ("resupply_all", (), _TARGET_SCHEMA),
+    ("repair_all", (), _TARGET_SCHEMA),
+)
+
+# API services whose effects are not visible to the poll, so they never trigger a refresh
+_NO_REFRESH_SERVICES = frozenset({"global_message", "send_comms_message"})
+
+
+@callback
+def async_update_single_entry(hass: HomeAssistant) -> None:
+    """Track the only loaded entry; call after an entry is added to or removed from hass.data."""
+    global _SINGLE_ENTRY_ID
+    entries = hass.data.get(DOMAIN) or _NO_ENTRIES
+    _SINGLE_ENTRY_ID = next(iter(entries)) if len(entries) == 1 else None
+
 
 def _get_coordinator(hass: HomeAssistant, call: ServiceCall):
-    """Resolve target entity or single instance to coordinator. Raises if not found."""
-    target = call.data.get("entity_id") or call.data.get("device_id")
+    """Resolve target entity, device or single instance to coordinator. Raises if not found."""
+    data = call.data
+    target = data.get("entity_id")
+    # HA device ids are opaque hex strings; route on which field was given, entity_id first
+    by_device = not target
+    if by_device:
+        target = data.get("device_id")
+    coordinators = hass.data.get(DOMAIN) or _NO_ENTRIES
     if not target:
-        entries = list(hass.data.get(DOMAIN, {}).keys())
-        if not entries:
+        if _SINGLE_ENTRY_ID is not None:
+            return coordinators[_SINGLE_ENTRY_ID]
+        if not coordinators:
             raise ValueError("No EmptyEpsilon integration configured")
-        if len(entries) != 1:
+        if len(coordinators) != 1:
             raise ValueError(
                 "Must specify entity_id when multiple EmptyEpsilon instances exist"
             )
-        return hass.data[DOMAIN][entries[0]]
+        return next(iter(coordinators.values()))
 
-    entity_reg = er.async_get(hass)
-    entity_id = target if isinstance(target, str) else target[0]
-    if entity_id.startswith("device_"):
-        dev_reg = hass.helpers.device_registry.async_get(hass)
-        device = dev_reg.async_get(entity_id)
+    target_id = target if isinstance(target, str) else target[0]
+    entry_id = _COORD_CACHE.get(target_id)
+    if entry_id is not None:
+        if entry_id in coordinators:
+            return coordinators[entry_id]
+        del _COORD_CACHE[target_id]
+
+    if by_device:
+        device = dr.async_get(hass).async_get(target_id)
         if not device:
-            raise ValueError(f"Device {entity_id} not found")
-        for ident in device.identifiers:
-            if ident[0] == DOMAIN and ident[1] in hass.data.get(DOMAIN, {}):
-                return hass.data[DOMAIN][ident[1]]
-        raise ValueError(f"Device {entity_id} is not an EmptyEpsilon device")
-    entity = entity_reg.async_get(entity_id)
+            raise ValueError(f"Device {target_id} not found")
+        match = next(
+            (eid for dom, eid in device.identifiers if dom == DOMAIN and eid in coordinators),
+            None,
+        )
+        if match is None:
+            raise ValueError(f"Device {target_id} is not an EmptyEpsilon device")
+        _COORD_CACHE[target_id] = match
+        return coordinators[match]
+    entity = er.async_get(hass).async_get(target_id)
     if not entity or entity.platform.domain != DOMAIN:
-        raise ValueError(f"Entity {entity_id} is not an EmptyEpsilon entity")
-    return hass.data[DOMAIN][entity.config_entry_id]
+        raise ValueError(f"Entity {target_id} is not an EmptyEpsilon entity")
+    _COORD_CACHE[target_id] = entity.config_entry_id
+    return coordinators[entity.config_entry_id]
 
 
-def _get_ssh_and_config(hass: HomeAssistant, call: ServiceCall):
-    """Get SSHManager and config dict for server management. Uses _get_coordinator logic."""
+@asynccontextmanager
+async def _ssh_session(
+    hass: HomeAssistant, call: ServiceCall
+) -> AsyncIterator[tuple[SSHManager, dict[str, Any]]]:
+    """Pooled SSHManager and config dict for server management, held exclusively for the block."""
     coord = _get_coordinator(hass, call)
-    cfg = coord._config
-    ssh = SSHManager(
-        host=cfg[CONF_SSH_HOST],
-        port=cfg.get(CONF_SSH_PORT, 22),
-        username=cfg[CONF_SSH_USERNAME],
-        password=cfg.get(CONF_SSH_PASSWORD) or None,
-        key_filename=(cfg.get(CONF_SSH_KEY) or "").strip() or None,
-        known_hosts=cfg.get(CONF_SSH_KNOWN_HOSTS),
-        skip_host_key_check=cfg.get(CONF_SSH_SKIP_HOST_KEY_CHECK, True),
-    )
-    return ssh, cfg
+    kwargs = coord.ssh_kwargs
+    # Keyed on the full connection settings so changed credentials get a fresh connection
+    key = tuple(kwargs.items())
+    async with _SSH_POOL_LOCK:
+        ssh = _SSH_POOL.get(key)
+        if ssh is None:
+            ssh = _SSH_POOL[key] = SSHManager(**kwargs)
+    # Concurrent calls for the same instance would share its log buffer and SFTP client
+    async with ssh.lock:
+        ssh.touch()
+        # Connect outside the pool lock so an unreachable host does not block other instances
+        if not ssh.connected:
+            # A failed connect is retried by run_command on first use
+            await ssh.ensure_connected()
+        yield ssh, coord._config
+
+
+async def _async_reap_ssh_pool() -> None:
+    """Disconnect pooled SSH connections that have been idle too long (they reconnect on demand)."""
+    async with _SSH_POOL_LOCK:
+        pool = list(_SSH_POOL.values())
+    for ssh in pool:
+        # Skip managers in use; taking an unlocked asyncio.Lock does not yield
+        if not ssh.lock.locked():
+            async with ssh.lock:
+                await ssh.reap_if_idle()
+
+
+async def async_evict_ssh_pool(ssh_kwargs: dict[str, Any]) -> None:
+    """Close and forget the pooled connection for an unloaded instance."""
+    async with _SSH_POOL_LOCK:
+        ssh = _SSH_POOL.pop(tuple(ssh_kwargs.items()), None)
+    if ssh is not None:
+        # Let an in-flight operation finish before closing its connection
+        async with ssh.lock:
+            await ssh.disconnect()
+
+
+async def _async_close_ssh_pool() -> None:
+    """Disconnect and forget all pooled SSH connections."""
+    async with _SSH_POOL_LOCK:
+        pool = list(_SSH_POOL.values())
+        _SSH_POOL.clear()
+    for ssh in pool:
+        await ssh.disconnect()
+
+
+def _make_api_handler(
+    hass: HomeAssistant,
+    method: str,
+    params: tuple[str, ...],
+) -> Callable[[ServiceCall], Coroutine[Any, Any, None]]:
+    """Build a handler that passes call.data fields to coord.api.<method> and requests a refresh."""
+    # Resolve the unbound EEAPIClient method once; handlers call it with coord.api as self
+    func = getattr(EEAPIClient, method)
+    refresh = method not in _NO_REFRESH_SERVICES
+
+    async def handler(call: ServiceCall) -> None:
+        coord = _get_coordinator(hass, call)
+        data = call.data
+        sent = await func(coord.api, **{field: data[field] for field in params})
+        if sent and refresh:
+            await coord.async_request_refresh()
+
+    return handler
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Register EmptyEpsilon services."""
 
-    async def global_message(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.global_message(call.data["message"])
-        await coord.async_request_refresh()
+    async def _close_ssh_pool(event: Event) -> None:
+        await _async_close_ssh_pool()
 
-    async def victory(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.victory(call.data.get("faction", "Human Navy"))
-        await coord.async_request_refresh()
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_ssh_pool)
 
-    async def spawn_player_ship(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.spawn_player_ship(
-            template=call.data.get("template", "Atlantis"),
-            callsign=call.data.get("callsign", "Epsilon"),
-            faction=call.data.get("faction", "Human Navy"),
-            x=float(call.data.get("x", 0)),
-            y=float(call.data.get("y", 0)),
-        )
-        await coord.async_request_refresh()
+    async def _reap_ssh_pool(now: datetime) -> None:
+        await _async_reap_ssh_pool()
+
+    async_track_time_interval(hass, _reap_ssh_pool, _SSH_REAP_INTERVAL)
+
+    @callback
+    def _invalidate_entity(event: Event) -> None:
+        _COORD_CACHE.pop(event.data["entity_id"], None)
+        if "old_entity_id" in event.data:
+            _COORD_CACHE.pop(event.data["old_entity_id"], None)
+
+    @callback
+    def _invalidate_device(event: Event) -> None:
+        _COORD_CACHE.pop(event.data["device_id"], None)
+
+    hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _invalidate_entity)
+    hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, _invalidate_device)
 
     async def exec_lua(call: ServiceCall) -> None:
         coord = _get_coordinator(hass, call)
+        if not coord.exec_lua_enabled:
+            raise ValueError("exec_lua is disabled for this EmptyEpsilon instance")
         result = await coord.api.exec_lua(call.data["code"])
-        _LOGGER.info("exec_lua result: %s", result[:200] if result else "")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("exec_lua result: %s", result[:200] if result else "")
 
     async def start_server(call: ServiceCall) -> None:
         try:
-            ssh, cfg = _get_ssh_and_config(hass, call)
-            install_path = cfg.get(CONF_EE_INSTALL_PATH, "/usr/local/bin")
-            ee_port = call.data.get("httpserver") or cfg.get(CONF_EE_PORT, 8080)
-            scenario = call.data.get("scenario") or cfg.get(CONF_SCENARIO, DEFAULT_INIT_SCENARIO)
-            sacn_universe = cfg.get(CONF_SACN_UNIVERSE, 2)
-            headless_name = cfg.get(CONF_HEADLESS_NAME, "EmptyEpsilon")
-            headless_internet = cfg.get(CONF_HEADLESS_INTERNET, False)
-            _LOGGER.info(
-                "start_server: host=%s install_path=%s port=%s scenario=%s",
-                cfg.get(CONF_SSH_HOST), install_path, ee_port, scenario,
-            )
-            try:
+            async with _ssh_session(hass, call) as (ssh, cfg):
+                install_path = cfg.get(CONF_EE_INSTALL_PATH, "/usr/local/bin")
+                ee_port = call.data.get("httpserver") or cfg.get(CONF_EE_PORT, 8080)
+                scenario = call.data.get("scenario") or cfg.get(CONF_SCENARIO, DEFAULT_INIT_SCENARIO)
+                sacn_universe = cfg.get(CONF_SACN_UNIVERSE, 2)
+                headless_name = cfg.get(CONF_HEADLESS_NAME, "EmptyEpsilon")
+                headless_internet = cfg.get(CONF_HEADLESS_INTERNET, False)
+                _LOGGER.info(
+                    "start_server: host=%s install_path=%s port=%s scenario=%s",
+                    cfg.get(CONF_SSH_HOST), install_path, ee_port, scenario,
+                )
                 deploy_ok = await ssh.deploy_hardware_ini(universe=sacn_universe)
                 _LOGGER.info("start_server: deploy_hardware_ini=%s", deploy_ok)
                 ok = await ssh.start_server(
@@ -130,11 +356,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     headless_internet=headless_internet,
                 )
                 _LOGGER.info("start_server: start_server result=%s", ok)
-                if ok:
-                    coord = _get_coordinator(hass, call)
-                    await coord.async_request_refresh()
-            finally:
-                await ssh.disconnect()
+            if ok:
+                coord = _get_coordinator(hass, call)
+                await coord.async_request_refresh()
         except Exception as e:
             _LOGGER.exception("start_server failed: %s", e)
             raise
@@ -147,307 +371,24 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.info("stop_server: shutdownGame() succeeded")
         except Exception as e:
             _LOGGER.warning("stop_server: shutdownGame() failed (%s), falling back to pkill", e)
-            ssh, _ = _get_ssh_and_config(hass, call)
-            try:
+            async with _ssh_session(hass, call) as (ssh, _):
                 await ssh.stop_server()
-            finally:
-                await ssh.disconnect()
         await coord.async_request_refresh()
 
     async def stop_server_forced(call: ServiceCall) -> None:
         """Force kill EmptyEpsilon process via SSH (pkill). Use when graceful shutdown fails."""
-        ssh, _ = _get_ssh_and_config(hass, call)
-        try:
+        async with _ssh_session(hass, call) as (ssh, _):
             await ssh.stop_server()
-            coord = _get_coordinator(hass, call)
-            await coord.async_request_refresh()
-        finally:
-            await ssh.disconnect()
-
-    async def spawn_cpu_ship(call: ServiceCall) -> None:
         coord = _get_coordinator(hass, call)
-        await coord.api.spawn_cpu_ship(
-            template=call.data.get("template", "Adder MK3"),
-            faction=call.data.get("faction", "Kraylor"),
-            x=float(call.data.get("x", 0)),
-            y=float(call.data.get("y", 0)),
-            order=call.data.get("order", "idle"),
-        )
         await coord.async_request_refresh()
 
-    async def spawn_station(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.spawn_station(
-            template=call.data.get("template", "Small Station"),
-            faction=call.data.get("faction", "Human Navy"),
-            x=float(call.data.get("x", 0)),
-            y=float(call.data.get("y", 0)),
-        )
-        await coord.async_request_refresh()
-
-    async def spawn_nebula(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.spawn_nebula(
-            x=float(call.data.get("x", 0)),
-            y=float(call.data.get("y", 0)),
+    for name, params, schema in _API_SERVICES:
+        hass.services.async_register(
+            DOMAIN, name, _make_api_handler(hass, name, params), schema=schema
         )
-        await coord.async_request_refresh()
-
-    async def spawn_asteroid(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.spawn_asteroid(
-            x=float(call.data.get("x", 0)),
-            y=float(call.data.get("y", 0)),
-        )
-        await coord.async_request_refresh()
-
-    async def send_comms_message(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.send_comms_message(
-            callsign=call.data["callsign"],
-            message=call.data["message"],
-        )
-        await coord.async_request_refresh()
-
-    async def modify_hull(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.modify_hull(
-            callsign=call.data["callsign"],
-            value=float(call.data.get("value", 100)),
-        )
-        await coord.async_request_refresh()
-
-    async def modify_shields(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.modify_shields(
-            callsign=call.data["callsign"],
-            front=float(call.data.get("front", 100)),
-            rear=float(call.data.get("rear", 100)),
-        )
-        await coord.async_request_refresh()
-
-    async def give_weapons(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.give_weapons(
-            callsign=call.data["callsign"],
-            homing=int(call.data.get("homing", 0)),
-            nuke=int(call.data.get("nuke", 0)),
-            emp=int(call.data.get("emp", 0)),
-            mine=int(call.data.get("mine", 0)),
-            hvli=int(call.data.get("hvli", 0)),
-        )
-        await coord.async_request_refresh()
-
-    async def red_alert_all(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.red_alert_all()
-        await coord.async_request_refresh()
-
-    async def resupply_all(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.resupply_all()
-        await coord.async_request_refresh()
-
-    async def repair_all(call: ServiceCall) -> None:
-        coord = _get_coordinator(hass, call)
-        await coord.api.repair_all()
-        await coord.async_request_refresh()
-
-    hass.services.async_register(
-        DOMAIN,
-        "global_message",
-        global_message,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Required("message"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "victory",
-        victory,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("faction", default="Human Navy"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "spawn_player_ship",
-        spawn_player_ship,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("template", default="Atlantis"): str,
-            vol.Optional("callsign", default="Epsilon"): str,
-            vol.Optional("faction", default="Human Navy"): str,
-            vol.Optional("x", default=0): vol.Coerce(float),
-            vol.Optional("y", default=0): vol.Coerce(float),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "exec_lua",
-        exec_lua,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Required("code"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "start_server",
-        start_server,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("scenario", default=DEFAULT_INIT_SCENARIO): str,
-            vol.Optional("httpserver"): vol.Coerce(int),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "stop_server",
-        stop_server,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "stop_server_forced",
-        stop_server_forced,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "spawn_cpu_ship",
-        spawn_cpu_ship,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("template", default="Adder MK3"): str,
-            vol.Optional("faction", default="Kraylor"): str,
-            vol.Optional("x", default=0): vol.Coerce(float),
-            vol.Optional("y", default=0): vol.Coerce(float),
-            vol.Optional("order", default="idle"): vol.In(["idle", "roam"]),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "spawn_station",
-        spawn_station,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("template", default="Small Station"): str,
-            vol.Optional("faction", default="Human Navy"): str,
-            vol.Optional("x", default=0): vol.Coerce(float),
-            vol.Optional("y", default=0): vol.Coerce(float),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "spawn_nebula",
-        spawn_nebula,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("x", default=0): vol.Coerce(float),
-            vol.Optional("y", default=0): vol.Coerce(float),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "spawn_asteroid",
-        spawn_asteroid,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Optional("x", default=0): vol.Coerce(float),
-            vol.Optional("y", default=0): vol.Coerce(float),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "send_comms_message",
-        send_comms_message,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Required("callsign"): str,
-            vol.Required("message"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "modify_hull",
-        modify_hull,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Required("callsign"): str,
-            vol.Optional("value", default=100): vol.Coerce(float),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "modify_shields",
-        modify_shields,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Required("callsign"): str,
-            vol.Optional("front", default=100): vol.Coerce(float),
-            vol.Optional("rear", default=100): vol.Coerce(float),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "give_weapons",
-        give_weapons,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-            vol.Required("callsign"): str,
-            vol.Optional("homing", default=0): vol.Coerce(int),
-            vol.Optional("nuke", default=0): vol.Coerce(int),
-            vol.Optional("emp", default=0): vol.Coerce(int),
-            vol.Optional("mine", default=0): vol.Coerce(int),
-            vol.Optional("hvli", default=0): vol.Coerce(int),
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "red_alert_all",
-        red_alert_all,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-        }),
-    )
-    hass.services.async_register(
-        DOMAIN,
-        "resupply_all",
-        resupply_all,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-        }),
-    )
+    hass.services.async_register(DOMAIN, "exec_lua", exec_lua, schema=_EXEC_LUA_SCHEMA)
+    hass.services.async_register(DOMAIN, "start_server", start_server, schema=_START_SERVER_SCHEMA)
+    hass.services.async_register(DOMAIN, "stop_server", stop_server, schema=_TARGET_SCHEMA)
     hass.services.async_register(
-        DOMAIN,
-        "repair_all",
-        repair_all,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Optional("device_id"): str,
-        }),
+        DOMAIN, "stop_server_forced", stop_server_forced, schema=_TARGET_SCHEMA
     )
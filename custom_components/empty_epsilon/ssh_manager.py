@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import logging
-import tempfile
-from pathlib import Path
-from typing import Any
+import secrets
+import shlex
+import socket
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, TypeVar
 
 from .const import (
+    CONF_SSH_HOST,
+    CONF_SSH_KEY,
+    CONF_SSH_KNOWN_HOSTS,
+    CONF_SSH_PASSWORD,
+    CONF_SSH_PORT,
+    CONF_SSH_SKIP_HOST_KEY_CHECK,
+    CONF_SSH_USERNAME,
     DEFAULT_INIT_SCENARIO,
     DEFAULT_SACN_CHANNELS,
     DEFAULT_SACN_UNIVERSE,
@@ -22,42 +34,87 @@ _LOGGER = logging.getLogger(__name__)
 # General integration log on the EE server: all actions and results
 EE_INTEGRATION_LOG = "/tmp/emptyepsilon_integration.log"
 
+# Keep pooled connections alive between operations; drop them after SSH_IDLE_TIMEOUT unused
+SSH_KEEPALIVE_INTERVAL = 30
+SSH_KEEPALIVE_COUNT_MAX = 3
+SSH_IDLE_TIMEOUT = 120.0
 
+# Send/receive buffer size requested for the SSH socket (SFTP uploads)
+SSH_SOCKET_BUF_BYTES = 1 << 20
+
+# Backoff between pgrep checks after launching EE (about 4.5 s in total)
+_START_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0, 1.0)
+
+# Separates the outputs of query commands batched into one run_command
+_SECTION_SEP = "---"
+
+_F = TypeVar("_F", bound=Callable[..., Awaitable[Any]])
+
+
+def _flushes_log(func: _F) -> _F:
+    """Write lines buffered by _log_remote to the integration log when func returns."""
+
+    @functools.wraps(func)
+    async def wrapper(self: SSHManager, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            await self._flush_log()
+
+    return wrapper  # type: ignore[return-value]
+
+
+# The channel/state blocks only depend on const.py tuples, so build them once at import
+_CHANNEL_BLOCKS = "".join(
+    f"[channel]\nname = {name}\nchannel = {ch}\n\n"
+    for (ch, *_), name in zip(SACN_CHANNEL_SPEC, SACN_CHANNEL_NAMES)
+)
+_STATE_BLOCKS = "".join(
+    "[state]\n"
+    "condition = Always\n"
+    f"target = {name}\n"
+    "effect = variable\n"
+    f"input = {ee_var}\n"
+    f"min_input = {min_in}\n"
+    f"max_input = {max_in}\n"
+    f"min_output = {min_out}\n"
+    f"max_output = {max_out}\n"
+    "\n"
+    for (_ch, ee_var, min_in, max_in, min_out, max_out), name in zip(
+        SACN_CHANNEL_SPEC, SACN_CHANNEL_NAMES
+    )
+)
+
+
+@functools.lru_cache(maxsize=8)
 def generate_hardware_ini(
     universe: int = DEFAULT_SACN_UNIVERSE,
     channels: int = DEFAULT_SACN_CHANNELS,
     resend_delay_ms: int = DEFAULT_RESEND_DELAY_MS,
 ) -> str:
-    """Generate hardware.ini content for EE sACN output."""
-    lines = [
-        "[hardware]",
-        "device = sACNDevice",
-        f"universe = {universe}",
-        f"channels = {channels}",
-        f"resend_delay = {resend_delay_ms}",
-        "",
-    ]
-    for (ch, _ee_var, min_in, max_in, min_out, max_out), name in zip(
-        SACN_CHANNEL_SPEC, SACN_CHANNEL_NAMES
-    ):
-        lines.append("[channel]")
-        lines.append(f"name = {name}")
-        lines.append(f"channel = {ch}")
-        lines.append("")
-    for (ch, ee_var, min_in, max_in, min_out, max_out), name in zip(
-        SACN_CHANNEL_SPEC, SACN_CHANNEL_NAMES
-    ):
-        lines.append("[state]")
-        lines.append("condition = Always")
-        lines.append(f"target = {name}")
-        lines.append("effect = variable")
-        lines.append(f"input = {ee_var}")
-        lines.append(f"min_input = {min_in}")
-        lines.append(f"max_input = {max_in}")
-        lines.append(f"min_output = {min_out}")
-        lines.append(f"max_output = {max_out}")
-        lines.append("")
-    return "\n".join(lines).strip() + "\n"
+    """Generate hardware.ini content for EE sACN output (cached; the channel spec is constant)."""
+    return (
+        "[hardware]\n"
+        "device = sACNDevice\n"
+        f"universe = {universe}\n"
+        f"channels = {channels}\n"
+        f"resend_delay = {resend_delay_ms}\n"
+        "\n"
+        f"{_CHANNEL_BLOCKS}{_STATE_BLOCKS}"
+    ).rstrip() + "\n"
+
+
+def ssh_kwargs_from_config(config: dict[str, Any]) -> dict[str, Any]:
+    """SSHManager keyword arguments from entry data (the one place CONF_SSH_* keys are mapped)."""
+    return {
+        "host": config[CONF_SSH_HOST],
+        "port": config.get(CONF_SSH_PORT, 22),
+        "username": config[CONF_SSH_USERNAME],
+        "password": config.get(CONF_SSH_PASSWORD) or None,
+        "key_filename": (config.get(CONF_SSH_KEY) or "").strip() or None,
+        "known_hosts": config.get(CONF_SSH_KNOWN_HOSTS),
+        "skip_host_key_check": config.get(CONF_SSH_SKIP_HOST_KEY_CHECK, True),
+    }
 
 
 class SSHManager:
@@ -81,12 +138,22 @@ class SSHManager:
         self._known_hosts = (known_hosts.strip() or None) if known_hosts else None
         self._skip_host_key_check = skip_host_key_check
         self._conn: Any = None
+        self._sftp: Any = None
+        self._remote_home: str | None = None
+        self._last_used: float = 0.0
+        self._connect_lock = asyncio.Lock()
+        # Held by callers for a whole operation: the log buffer, SFTP client and log reset are per manager
+        self.lock = asyncio.Lock()
+        # Integration log lines waiting for the next _flush_log (one SSH command per batch)
+        self._pending_log: list[str] = []
 
     def _connect_kwargs(self, known_hosts_obj: Any = None) -> dict[str, Any]:
         kwargs = {
             "host": self._host,
             "port": self._port,
             "username": self._username,
+            "keepalive_interval": SSH_KEEPALIVE_INTERVAL,
+            "keepalive_count_max": SSH_KEEPALIVE_COUNT_MAX,
         }
         if self._key_filename:
             kwargs["client_keys"] = [self._key_filename]
@@ -100,6 +167,7 @@ class SSHManager:
 
     async def connect(self) -> bool:
         """Establish SSH connection. Returns True on success."""
+        # Normally already imported by async_setup_entry; fall back to an executor import
         import sys
         if "asyncssh" not in sys.modules:
             await asyncio.to_thread(__import__, "asyncssh")
@@ -107,23 +175,48 @@ class SSHManager:
 
         known_hosts_obj = None
         if not self._skip_host_key_check and self._known_hosts:
-            path = Path(self._known_hosts)
-            if path.exists():
-                content = await asyncio.to_thread(path.read_text, encoding="utf-8")
-                known_hosts_obj = asyncssh.import_known_hosts(content)
+            # asyncssh reads and parses the file; keep it in a thread so the loop never blocks on disk
+            try:
+                known_hosts_obj = await asyncio.to_thread(asyncssh.read_known_hosts, self._known_hosts)
+            except OSError as e:
+                _LOGGER.debug("known_hosts %s not loaded: %s", self._known_hosts, e)
 
         try:
-            self._conn = await asyncio.wait_for(
-                asyncssh.connect(**self._connect_kwargs(known_hosts_obj)),
-                timeout=15.0,
-            )
+            async with asyncio.timeout(15.0):
+                self._conn = await asyncssh.connect(**self._connect_kwargs(known_hosts_obj))
+            self._configure_socket(self._conn.get_extra_info("socket"))
+            self.touch()
             return True
         except Exception as e:
             _LOGGER.warning("SSH connect failed: %s", e)
             return False
 
+    async def ensure_connected(self) -> bool:
+        """Connect unless already connected; concurrent callers share one attempt."""
+        async with self._connect_lock:
+            if self._conn is not None:
+                return True
+            return await self.connect()
+
+    def _configure_socket(self, sock: Any) -> None:
+        """Disable Nagle and enlarge buffers so small SFTP writes are not delayed."""
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SSH_SOCKET_BUF_BYTES)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SSH_SOCKET_BUF_BYTES)
+        except OSError as e:
+            _LOGGER.debug("SSH socket options not applied: %s", e)
+
+    @property
+    def connected(self) -> bool:
+        """True while an SSH connection is open."""
+        return self._conn is not None
+
     async def disconnect(self) -> None:
-        """Close SSH connection."""
+        """Close SFTP client and SSH connection."""
+        self._close_sftp()
         if self._conn:
             try:
                 self._conn.close()
@@ -131,17 +224,40 @@ class SSHManager:
             except Exception:
                 pass
             self._conn = None
+        self._remote_home = None
+
+    def _drop_connection(self) -> None:
+        """Close a connection that just failed; the next command reconnects."""
+        self._close_sftp()
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def touch(self) -> None:
+        """Mark the connection as in use so reap_if_idle leaves it open."""
+        self._last_used = time.monotonic()
+
+    async def reap_if_idle(self, idle_s: float = SSH_IDLE_TIMEOUT) -> bool:
+        """Disconnect if the connection has not been used for idle_s seconds. Returns True if closed."""
+        if self._conn is None or time.monotonic() - self._last_used <= idle_s:
+            return False
+        _LOGGER.debug("Closing idle SSH connection to %s:%s", self._host, self._port)
+        await self.disconnect()
+        return True
 
     async def run_command(self, command: str, timeout: float = 30.0) -> tuple[int, str, str]:
         """Run a command. Returns (exit_status, stdout, stderr)."""
         if not self._conn:
-            if not await self.connect():
+            if not await self.ensure_connected():
                 return -1, "", "SSH not connected"
+        self.touch()
         try:
-            result = await asyncio.wait_for(
-                self._conn.run(command),
-                timeout=timeout,
-            )
+            async with asyncio.timeout(timeout):
+                result = await self._conn.run(command)
+            self.touch()
             return (
                 result.exit_status,
                 result.stdout or "",
@@ -149,25 +265,63 @@ class SSHManager:
             )
         except Exception as e:
             _LOGGER.warning("SSH command failed: %s", e)
-            self._conn = None
+            # Close rather than just forget it, or keepalives hold the session open on the server
+            self._drop_connection()
             return -1, "", str(e)
 
-    async def _clear_integration_log(self) -> None:
-        """Clear the integration log on the EE server (fresh log for each run)."""
-        await self.run_command(f"> {EE_INTEGRATION_LOG}", timeout=5.0)
+    async def _get_home(self) -> str | None:
+        """Remote $HOME, resolved over SSH once and then cached until disconnect."""
+        if self._remote_home is None:
+            status, out, err = await self.run_command("echo $HOME")
+            if status != 0 or not out.strip():
+                _LOGGER.warning("Could not resolve remote HOME: %s %s", out, err)
+                return None
+            self._remote_home = out.strip()
+        return self._remote_home
 
-    async def _log_remote(self, action: str, message: str, status: str | None = None) -> None:
-        """Append an action/result line to the integration log on the EE server."""
+    async def run_command_with_log_reset(
+        self, command: str, timeout: float = 30.0
+    ) -> tuple[int, str, str]:
+        """Truncate the integration log (fresh log for each run) and run command in one call."""
+        # Buffered lines are not on the remote yet, so they survive the truncation
+        return await self.run_command(f"> {EE_INTEGRATION_LOG}; {command}", timeout=timeout)
+
+    def _log_remote(self, action: str, message: str, status: str | None = None) -> None:
+        """Buffer an action/result line for the integration log on the EE server."""
         line = f"{action}: {message}"
         if status is not None:
             line += f" [status={status}]"
-        # Use printf to avoid shell interpretation of message content
-        escaped = line.replace("'", "'\"'\"'")
+        # Timestamped locally, in the same format as the remote `date -Iseconds`
+        stamp = datetime.now().astimezone().isoformat(timespec="seconds")
+        self._pending_log.append(f"{stamp} [HA] {line}")
+
+    async def _flush_log(self) -> None:
+        """Append all buffered log lines to the integration log in a single command."""
+        if not self._pending_log:
+            return
+        body = "\n".join(self._pending_log)
+        self._pending_log.clear()
+        # Quoted heredoc: the shell passes the body through verbatim, no escaping needed.
+        # A random terminator so no message line can end the heredoc early.
+        eof = f"EE_LOG_EOF_{secrets.token_hex(8)}"
         await self.run_command(
-            f"printf '%s [HA] %s\\n' \"$(date -Iseconds 2>/dev/null || date)\" '{escaped}' >> {EE_INTEGRATION_LOG}",
-            timeout=5.0,
+            f"cat >> {EE_INTEGRATION_LOG} <<'{eof}'\n{body}\n{eof}", timeout=5.0
         )
 
+    async def _get_sftp(self) -> Any:
+        """SFTP client on the current connection, opened on first use and then reused."""
+        if self._sftp is None:
+            self._sftp = await self._conn.start_sftp_client()
+        return self._sftp
+
+    def _close_sftp(self) -> None:
+        if self._sftp is not None:
+            try:
+                self._sftp.exit()
+            except Exception:
+                pass
+            self._sftp = None
+
     async def upload_string(
         self,
         content: str,
@@ -176,29 +330,24 @@ class SSHManager:
     ) -> bool:
         """Upload string content to a remote file (e.g. hardware.ini)."""
         if not self._conn:
-            if not await self.connect():
+            if not await self.ensure_connected():
                 return False
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".ini", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(content)
-            local_path = f.name
+        self.touch()
         try:
-            sftp = await asyncio.wait_for(
-                self._conn.start_sftp_client(),
-                timeout=timeout,
-            )
-            await asyncio.wait_for(
-                sftp.put(local_path, remote_path),
-                timeout=timeout,
-            )
+            async with asyncio.timeout(timeout):
+                sftp = await self._get_sftp()
+                # Write straight to the remote file; no local temp file needed
+                async with sftp.open(remote_path, "w", encoding="utf-8") as f:
+                    await f.write(content)
+            self.touch()
             return True
         except Exception as e:
             _LOGGER.warning("SFTP upload failed: %s", e)
+            # Reopen the subsystem on the next upload
+            self._close_sftp()
             return False
-        finally:
-            Path(local_path).unlink(missing_ok=True)
 
+    @_flushes_log
     async def start_server(
         self,
         ee_install_path: str,
@@ -213,18 +362,22 @@ class SSHManager:
         All actions and EE output go to /tmp/emptyepsilon_integration.log on the EE server.
         Returns True if the server is running (existing or newly started).
         """
-        await self._log_remote("start_server", "checking if EmptyEpsilon already running")
-        _cmd = "pgrep EmptyEpsilon || true"
-        await self._log_remote("start_server", f"about to run: {_cmd}")
+        self._log_remote("start_server", "checking if EmptyEpsilon already running")
+        # Resolve $HOME in the same round-trip so deploy_options_ini can skip its own lookup
+        _cmd = f"pgrep EmptyEpsilon || true; echo {_SECTION_SEP}; echo $HOME"
+        self._log_remote("start_server", f"about to run: {_cmd}")
         check_status, check_out, check_err = await self.run_command(
             _cmd,
             timeout=5.0,
         )
-        await self._log_remote("start_server", f"pgrep result: status={check_status} pids={check_out.strip() or '(none)'}")
+        check_out, _, home = check_out.partition(f"{_SECTION_SEP}\n")
+        if check_status == 0 and home.strip() and self._remote_home is None:
+            self._remote_home = home.strip()
+        self._log_remote("start_server", f"pgrep result: status={check_status} pids={check_out.strip() or '(none)'}")
         _LOGGER.debug("pgrep check: status=%s out=%r err=%r", check_status, check_out, check_err)
         if check_out.strip():
             _LOGGER.info("EmptyEpsilon already running, skipping start")
-            await self._log_remote("start_server", "skipped - already running")
+            self._log_remote("start_server", "skipped - already running")
             return True
 
         base = ee_install_path.rstrip("/")
@@ -242,49 +395,55 @@ class SSHManager:
             f"nohup {ee_bin} >> {EE_INTEGRATION_LOG} 2>&1 & )"
         )
         full_cmd = f'bash -l -c "{cmd}"'
-        await self._log_remote("start_server", f"about to run: {full_cmd}")
+        self._log_remote("start_server", f"about to run: {full_cmd}")
+        # EE appends its own output to the same log; write our lines first to keep order
+        await self._flush_log()
         _LOGGER.info("Running start command on %s:%s", self._host, self._port)
         status, out, err = await self.run_command(
             full_cmd,
             timeout=15.0,
         )
-        await self._log_remote("start_server", f"nohup launched: status={status} stdout={out[:100] if out else ''} stderr={err[:100] if err else ''}")
+        self._log_remote("start_server", f"nohup launched: status={status} stdout={out[:100] if out else ''} stderr={err[:100] if err else ''}")
         if status != 0:
             _LOGGER.warning(
                 "Start server command failed (status=%s): %s %s",
                 status, out.strip(), err.strip(),
             )
             return False
-        await asyncio.sleep(2)
-        await self._log_remote("start_server", "verifying process started")
+        self._log_remote("start_server", "verifying process started")
         _verify_cmd = "pgrep EmptyEpsilon || true"
-        await self._log_remote("start_server", f"about to run: {_verify_cmd}")
-        check_status, check_out, _ = await self.run_command(
-            _verify_cmd,
-            timeout=5.0,
-        )
-        await self._log_remote("start_server", f"verify pgrep: status={check_status} pids={check_out.strip() or '(none)'}")
+        self._log_remote("start_server", f"about to run (polling): {_verify_cmd}")
+        # Return as soon as the process shows up instead of always waiting the worst case
+        for delay in _START_POLL_DELAYS:
+            await asyncio.sleep(delay)
+            check_status, check_out, _ = await self.run_command(
+                _verify_cmd,
+                timeout=3.0,
+            )
+            if check_out.strip():
+                break
+        self._log_remote("start_server", f"verify pgrep: status={check_status} pids={check_out.strip() or '(none)'}")
         if not check_out.strip():
             _LOGGER.warning(
                 "EmptyEpsilon start command ran but no process found. Check %s on the EE server.",
                 EE_INTEGRATION_LOG,
             )
-            await self._log_remote("start_server", "FAILED - no process found after start")
+            self._log_remote("start_server", "FAILED - no process found after start")
             return False
         _LOGGER.info(
             "EmptyEpsilon start sent: %s (httpserver=%s)",
             scenario, ee_port,
         )
-        await self._log_remote("start_server", f"SUCCESS - process running (httpserver={ee_port})")
+        self._log_remote("start_server", f"SUCCESS - process running (httpserver={ee_port})")
         return True
 
+    @_flushes_log
     async def stop_server(self) -> bool:
         """Stop EmptyEpsilon by killing the process on the EE host via SSH."""
-        await self._clear_integration_log()
         cmd = "pkill EmptyEpsilon || true"
-        await self._log_remote("stop_server", f"about to run: {cmd}")
-        status, out, err = await self.run_command(cmd, timeout=15.0)
-        await self._log_remote("stop_server", f"result: status={status} out={out.strip() or ''} err={err.strip() or ''}")
+        self._log_remote("stop_server", f"about to run: {cmd}")
+        status, out, err = await self.run_command_with_log_reset(cmd, timeout=15.0)
+        self._log_remote("stop_server", f"result: status={status} out={out.strip() or ''} err={err.strip() or ''}")
         if status != 0:
             _LOGGER.warning(
                 "Stop server command failed (status=%s): %s %s",
@@ -294,37 +453,42 @@ class SSHManager:
         _LOGGER.info("EmptyEpsilon stop sent")
         return True
 
+    @_flushes_log
     async def deploy_hardware_ini(
         self,
         universe: int = DEFAULT_SACN_UNIVERSE,
         channels: int = DEFAULT_SACN_CHANNELS,
     ) -> bool:
         """Generate hardware.ini and upload to EE config dir (~/.emptyepsilon/)."""
-        await self._clear_integration_log()
-        await self._log_remote("deploy_hardware_ini", "starting", "universe=" + str(universe))
-        _cmd = "echo $HOME"
-        await self._log_remote("deploy_hardware_ini", f"about to run: {_cmd}")
-        status, out, err = await self.run_command(_cmd)
-        await self._log_remote("deploy_hardware_ini", f"echo HOME -> status={status} home={out.strip() or err}")
-        if status != 0:
-            _LOGGER.warning("Could not resolve remote HOME: %s %s", out, err)
+        self._log_remote("deploy_hardware_ini", "starting", "universe=" + str(universe))
+        home = await self._get_home()
+        self._log_remote("deploy_hardware_ini", f"remote HOME -> {home}")
+        if home is None:
             return False
-        home = out.strip()
         remote_dir = f"{home}/.emptyepsilon"
         remote_path = f"{remote_dir}/hardware.ini"
-        _mkdir_cmd = f"mkdir -p {remote_dir}"
-        await self._log_remote("deploy_hardware_ini", f"about to run: {_mkdir_cmd}")
-        mkdir_status, _, _ = await self.run_command(_mkdir_cmd)
-        await self._log_remote("deploy_hardware_ini", f"mkdir -p {remote_dir} -> status={mkdir_status}")
+        content = generate_hardware_ini(universe=universe, channels=channels)
+        local_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        # mkdir and report the current file's hash in the same round-trip
+        _mkdir_cmd = (
+            f"mkdir -p {shlex.quote(remote_dir)} && "
+            f"{{ sha256sum {shlex.quote(remote_path)} 2>/dev/null || true; }}"
+        )
+        self._log_remote("deploy_hardware_ini", f"about to run: {_mkdir_cmd}")
+        mkdir_status, out, _ = await self.run_command_with_log_reset(_mkdir_cmd)
+        self._log_remote("deploy_hardware_ini", f"mkdir -p {remote_dir} -> status={mkdir_status}")
         if mkdir_status != 0:
             _LOGGER.warning("Could not create %s on remote", remote_dir)
             return False
-        content = generate_hardware_ini(universe=universe, channels=channels)
-        await self._log_remote("deploy_hardware_ini", f"about to upload (SFTP): {remote_path}")
+        if out.split(maxsplit=1)[:1] == [local_hash]:
+            self._log_remote("deploy_hardware_ini", f"{remote_path} unchanged, skipping upload")
+            return True
+        self._log_remote("deploy_hardware_ini", f"about to upload (SFTP): {remote_path}")
         upload_ok = await self.upload_string(content, remote_path)
-        await self._log_remote("deploy_hardware_ini", f"upload to {remote_path} -> ok={upload_ok}")
+        self._log_remote("deploy_hardware_ini", f"upload to {remote_path} -> ok={upload_ok}")
         return upload_ok
 
+    @_flushes_log
     async def deploy_options_ini(
         self,
         scenario: str,
@@ -337,22 +501,18 @@ class SSHManager:
         Merges with existing file to preserve user preferences.
         See https://github.com/daid/EmptyEpsilon/wiki/Headless-Dedicated-Server
         """
-        await self._log_remote("deploy_options_ini", "starting")
-        _cmd = "echo $HOME"
-        await self._log_remote("deploy_options_ini", f"about to run: {_cmd}")
-        status, out, err = await self.run_command(_cmd)
-        if status != 0:
-            _LOGGER.warning("Could not resolve remote HOME: %s %s", out, err)
+        self._log_remote("deploy_options_ini", "starting")
+        home = await self._get_home()
+        if home is None:
             return False
-        home = out.strip()
         remote_dir = f"{home}/.emptyepsilon"
         options_path = f"{remote_dir}/options.ini"
-        for d in (remote_dir, f"{home}/logs"):
-            _mkdir_cmd = f"mkdir -p {d}"
-            await self._log_remote("deploy_options_ini", f"about to run: {_mkdir_cmd}")
-            mkdir_status, _, _ = await self.run_command(_mkdir_cmd)
-            if mkdir_status != 0:
-                return False
+        # mkdir -p takes both paths: one round-trip instead of one per directory
+        _mkdir_cmd = f"mkdir -p {shlex.quote(remote_dir)} {shlex.quote(f'{home}/logs')}"
+        self._log_remote("deploy_options_ini", f"about to run: {_mkdir_cmd}")
+        mkdir_status, _, _ = await self.run_command(_mkdir_cmd)
+        if mkdir_status != 0:
+            return False
 
         our_keys = {
             "headless": scenario,
@@ -361,23 +521,32 @@ class SSHManager:
             "headless_internet": "1" if headless_internet else "0",
             "startpaused": "1",
         }
-        await self._log_remote("deploy_options_ini", f"options: {our_keys}")
+        self._log_remote("deploy_options_ini", f"options: {our_keys}")
 
-        status, existing, _ = await self.run_command(
-            f"test -f {options_path} && cat {options_path} || echo ''",
-            timeout=5.0,
+        # Merge on the server in one command: keep every key=value line that is not ours
+        # (trailing whitespace trimmed), append ours, then swap the file in atomically if it differs
+        path = shlex.quote(options_path)
+        tmp_path = shlex.quote(f"{options_path}.new")
+        keep_theirs = (
+            "awk -v keys=" + shlex.quote("|".join(our_keys)) + " "
+            + shlex.quote(
+                'BEGIN { n = split(keys, a, "|"); for (i = 1; i <= n; i++) ours[a[i]] = 1 } '
+                'index($0, "=") { k = substr($0, 1, index($0, "=") - 1); '
+                'gsub(/^[ \\t\\r]+|[ \\t\\r]+$/, "", k); '
+                'if (!(k in ours)) { sub(/[ \\t\\r]+$/, ""); print } }'
+            )
+            + f" {path}"
+        )
+        ours = " ".join(shlex.quote(f"{k}={v}") for k, v in our_keys.items())
+        merge_cmd = (
+            f"{{ if [ -f {path} ]; then {keep_theirs}; fi; printf '%s\\n' {ours}; }} > {tmp_path}"
+            # Leave the file untouched when the merge changed nothing
+            f" && {{ cmp -s {tmp_path} {path} && rm -f {tmp_path} || mv {tmp_path} {path}; }}"
         )
-        lines = []
-        if existing.strip():
-            for line in existing.strip().split("\n"):
-                if "=" in line:
-                    key = line.split("=")[0].strip()
-                    if key not in our_keys:
-                        lines.append(line.rstrip())
-        for k, v in our_keys.items():
-            lines.append(f"{k}={v}")
-        content = "\n".join(lines) + "\n"
-        await self._log_remote("deploy_options_ini", f"about to upload: {options_path}")
-        ok = await self.upload_string(content, options_path)
-        await self._log_remote("deploy_options_ini", f"upload result: ok={ok}")
+        self._log_remote("deploy_options_ini", f"about to merge: {options_path}")
+        status, _, err = await self.run_command(merge_cmd, timeout=10.0)
+        ok = status == 0
+        if not ok:
+            _LOGGER.warning("Could not update %s: %s", options_path, err.strip())
+        self._log_remote("deploy_options_ini", f"merge result: status={status}")
         return ok
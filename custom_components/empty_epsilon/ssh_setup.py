@@ -1,10 +1,9 @@
-"""SSH setup helpers (key generation, known_hosts). Run in executor to avoid blocking."""
+"""SSH setup helpers (key generation, known_hosts, connection check)."""
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import subprocess
 from pathlib import Path
 from typing import Any
 
@@ -51,32 +50,36 @@ def generate_ssh_key() -> tuple[str, str]:
     return EE_KEY_PATH, EE_PUBKEY_PATH
 
 
-def fetch_and_save_host_key(host: str, port: int) -> str | None:
+def _append_known_host(line: str) -> None:
+    _ensure_config_dir()
+    with open(EE_KNOWN_HOSTS_PATH, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+async def fetch_and_save_host_key(host: str, port: int) -> str | None:
     """
-    Run ssh-keyscan to fetch host key and append to known_hosts.
-    Returns known_hosts path on success, None if ssh-keyscan unavailable.
-    Must run in executor.
+    Fetch the server's host key with asyncssh (no auth, no ssh-keyscan) and append to known_hosts.
+    Returns known_hosts path on success, None if the key could not be fetched.
     """
+    import asyncssh
+
     try:
-        result = subprocess.run(
-            ["ssh-keyscan", "-p", str(port), host],
-            capture_output=True,
-            timeout=10,
-            check=False,
-        )
-        if result.returncode != 0 or not result.stdout:
-            _LOGGER.debug("ssh-keyscan failed or empty: %s", result.stderr)
-            return None
-        _ensure_config_dir()
-        with open(EE_KNOWN_HOSTS_PATH, "a", encoding="utf-8") as f:
-            f.write(result.stdout.decode("utf-8"))
-        return EE_KNOWN_HOSTS_PATH
-    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-        _LOGGER.debug("ssh-keyscan not available or timed out: %s", e)
+        async with asyncio.timeout(10):
+            key = await asyncssh.get_server_host_key(host, port)
+    except (OSError, asyncssh.Error, TimeoutError) as e:
+        _LOGGER.debug("Host key fetch failed or timed out: %s", e)
         return None
+    if key is None:
+        _LOGGER.debug("Host key fetch returned no key")
+        return None
+    # known_hosts names non-default ports as [host]:port
+    name = host if port == 22 else f"[{host}]:{port}"
+    public_key = key.export_public_key("openssh").decode("utf-8").strip()
+    await asyncio.to_thread(_append_known_host, f"{name} {public_key}\n")
+    return EE_KNOWN_HOSTS_PATH
 
 
-def validate_ssh_sync(
+async def validate_ssh(
     host: str,
     port: int,
     username: str,
@@ -87,38 +90,27 @@ def validate_ssh_sync(
     save_host_key_on_first_connect: bool = True,
 ) -> tuple[bool, str | None, str | None]:
     """
-    Validate SSH connection. Runs in executor to avoid blocking.
+    Validate SSH connection on the running event loop.
     Returns (success, error_message, saved_known_hosts_path).
     If save_host_key_on_first_connect and we connect with skip, fetches host key.
     """
-    import asyncssh
-
     from .ssh_manager import SSHManager
 
-    async def _connect() -> tuple[bool, str | None, str | None]:
-        ssh = SSHManager(
-            host, port, username,
-            password, key_filename,
-            known_hosts=known_hosts,
-            skip_host_key_check=skip_host_key_check,
-        )
-        saved_path: str | None = None
-        try:
-            ok = await ssh.connect()
-            if ok and skip_host_key_check and save_host_key_on_first_connect:
-                saved_path = await asyncio.to_thread(
-                    fetch_and_save_host_key, host, port
-                )
-            if ok:
-                await ssh.disconnect()
-                return True, None, saved_path
-            return False, "cannot_connect_ssh", None
-        except Exception as e:
-            _LOGGER.debug("SSH validation failed: %s", e)
-            return False, str(e) or "cannot_connect_ssh", None
-
+    ssh = SSHManager(
+        host, port, username,
+        password, key_filename,
+        known_hosts=known_hosts,
+        skip_host_key_check=skip_host_key_check,
+    )
+    saved_path: str | None = None
     try:
-        return asyncio.run(_connect())
+        ok = await ssh.connect()
+        if ok and skip_host_key_check and save_host_key_on_first_connect:
+            saved_path = await fetch_and_save_host_key(host, port)
+        if ok:
+            await ssh.disconnect()
+            return True, None, saved_path
+        return False, "cannot_connect_ssh", None
     except Exception as e:
-        _LOGGER.debug("SSH validation error: %s", e)
+        _LOGGER.debug("SSH validation failed: %s", e)
         return False, str(e) or "cannot_connect_ssh", None
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import EmptyEpsilonCoordinator
+from .ee_api import EEAPIError
 from .entity import EmptyEpsilonEntity
 
+_LOGGER = logging.getLogger(__name__)
+
+# Trailing window for pause/unpause toggles; only the last requested state is sent
+PAUSE_DISPATCH_DELAY = 0.2
+
+# Give up on an optimistic state EE has not confirmed after this many seconds (command rejected)
+OPTIMISTIC_TIMEOUT = 5.0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,34 +49,102 @@ class EmptyEpsilonPauseSwitch(EmptyEpsilonEntity, SwitchEntity):
         # Optimistic state: when user toggles, show the new state immediately until
         # coordinator refresh returns real data (avoids stale/wrong state from immediate refresh).
         self._optimistic_paused: bool | None = None
+        # Debounced dispatch: rapid toggles collapse into one API call for the last state
+        self._pending_target: bool | None = None
+        self._dispatch_handle: asyncio.TimerHandle | None = None
+        self._optimistic_expiry: asyncio.TimerHandle | None = None
+        # coordinator.fetch_seq when the last command was sent; older polls cannot confirm it
+        self._last_action_seq: int = 0
 
     @property
     def is_on(self) -> bool:
         """Return True if game is paused."""
-        if self._optimistic_paused is not None:
-            return self._optimistic_paused
-        return bool(self.coordinator.data.get("http", {}).get("paused"))
+        return self._optimistic_paused if self._optimistic_paused is not None else self.coordinator.paused
 
+    @callback
     def _handle_coordinator_update(self) -> None:
-        """Clear optimistic state when we get real data."""
+        """Clear optimistic state once EE reports the same value; re-poll while it is still stale."""
+        # Polls that started before the last command went out may still show the old state
+        if self._optimistic_paused is not None and self.coordinator.data_seq > self._last_action_seq:
+            if self.coordinator.paused == self._optimistic_paused:
+                self._clear_optimistic()
+            elif self._pending_target is None:
+                # Command already sent but not applied yet: keep showing it and check again
+                self.hass.async_create_task(self.coordinator.async_request_refresh())
+        self.async_write_ha_state()
+
+    @callback
+    def _clear_optimistic(self) -> None:
+        self._optimistic_paused = None
+        if self._optimistic_expiry is not None:
+            self._optimistic_expiry.cancel()
+            self._optimistic_expiry = None
+
+    @callback
+    def _expire_optimistic(self) -> None:
+        """EE never confirmed the toggle: fall back to the reported state."""
+        self._optimistic_expiry = None
         self._optimistic_paused = None
         self.async_write_ha_state()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop an unsent toggle so it does not fire against an unloaded entry."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+        self._pending_target = None
+        self._clear_optimistic()
+        await super().async_will_remove_from_hass()
+
     async def async_turn_on(self, **kwargs) -> None:
         """Pause the game."""
-        await self.coordinator.api.pause_game()
-        self._optimistic_paused = True
-        self.async_write_ha_state()
-        # Delayed refresh so EE has time to process; coordinator will report real state
-        self.hass.loop.call_later(1.5, self._delayed_refresh)
+        self._request_state(True)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Unpause the game."""
-        await self.coordinator.api.unpause_game()
-        self._optimistic_paused = False
+        self._request_state(False)
+
+    @callback
+    def _request_state(self, target: bool) -> None:
+        """Show target immediately and send it after PAUSE_DISPATCH_DELAY unless superseded."""
+        if self._optimistic_paused is None and self.coordinator.paused == target:
+            # Already in that state with nothing in flight (scene restore, repeated automation)
+            return
+        self._optimistic_paused = target
+        if self._optimistic_expiry is not None:
+            self._optimistic_expiry.cancel()
+        # A timer rather than a deadline check on update: unchanged data does not notify listeners
+        self._optimistic_expiry = self.hass.loop.call_later(
+            OPTIMISTIC_TIMEOUT, self._expire_optimistic
+        )
         self.async_write_ha_state()
-        self.hass.loop.call_later(1.5, self._delayed_refresh)
+        self._pending_target = target
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+        self._dispatch_handle = self.hass.loop.call_later(
+            PAUSE_DISPATCH_DELAY, self._dispatch
+        )
+
+    @callback
+    def _dispatch(self) -> None:
+        self._dispatch_handle = None
+        self.hass.async_create_task(self._flush())
 
-    def _delayed_refresh(self) -> None:
-        """Request coordinator refresh after EE has processed pause/unpause."""
-        self.hass.async_create_task(self.coordinator.async_request_refresh())
+    async def _flush(self) -> None:
+        """Send the latest requested pause state to EE."""
+        target, self._pending_target = self._pending_target, None
+        if target is None:
+            return
+        try:
+            if target:
+                await self.coordinator.api.pause_game()
+            else:
+                await self.coordinator.api.unpause_game()
+        except EEAPIError as e:
+            # exec_lua maps HTTP failures and timeouts to EEAPIError
+            _LOGGER.warning("Could not %s game: %s", "pause" if target else "unpause", e)
+        finally:
+            # Runs on any outcome so the optimistic state is always reconciled with EE
+            self._last_action_seq = self.coordinator.fetch_seq
+            # The coordinator's request debouncer delays this so EE has time to process
+            await self.coordinator.async_request_refresh()